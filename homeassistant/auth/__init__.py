@@ -24,7 +24,12 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN, REFRESH_TOKEN_EXPIRATION
+from .const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+    REFRESH_TOKEN_EXPIRATION,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .models import AuthFlowResult
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
@@ -176,6 +181,11 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
+        # Access tokens that passed signature verification, mapped to
+        # their refresh token and expiration time
+        self._verified_access_tokens: OrderedDict[
+            str, tuple[models.RefreshToken, float]
+        ] = OrderedDict()
         self._expire_callback: CALLBACK_TYPE | None = None
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
@@ -343,6 +353,7 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(user_id=user.id)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -383,6 +394,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_forget_access_tokens(user_id=user.id)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -511,6 +523,7 @@ class AuthManager:
     def async_remove_refresh_token(self, refresh_token: models.RefreshToken) -> None:
         """Delete a refresh token."""
         self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(refresh_token_id=refresh_token.id)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, ())
         for revoke_callback in callbacks:
@@ -632,6 +645,18 @@ class AuthManager:
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if cached := self._verified_access_tokens.get(token):
+            refresh_token, expire_at = cached
+            if (
+                time.time() < expire_at
+                and refresh_token.user.is_active
+                and self._store.async_get_refresh_token(refresh_token.id)
+                is refresh_token
+            ):
+                self._verified_access_tokens.move_to_end(token)
+                return refresh_token
+            del self._verified_access_tokens[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -649,7 +674,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -658,8 +683,21 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._verified_access_tokens[token] = (refresh_token, claims["exp"])
+        if len(self._verified_access_tokens) > ACCESS_TOKEN_CACHE_SIZE:
+            self._verified_access_tokens.popitem(last=False)
+
         return refresh_token
 
+    @callback
+    def _async_forget_access_tokens(
+        self, *, refresh_token_id: str | None = None, user_id: str | None = None
+    ) -> None:
+        """Drop verified access tokens of a refresh token or user from the cache."""
+        for token, (refresh_token, _) in list(self._verified_access_tokens.items()):
+            if refresh_token.id == refresh_token_id or refresh_token.user.id == user_id:
+                del self._verified_access_tokens[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -8,7 +8,7 @@ import itertools
 from logging import getLogger
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -296,6 +296,29 @@ class AuthStore:
             refresh_token.expire_at = None
             self._async_schedule_save()
 
+    @callback
+    def _async_track_registry_changes(self) -> None:
+        """Track registry changes that can alter device and area permissions."""
+        self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            event_filter=_entity_registry_changed_filter,
+        )
+        self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            event_filter=_device_registry_changed_filter,
+        )
+
+    @callback
+    def _async_registry_updated(
+        self,
+        event: Event[er.EventEntityRegistryUpdatedData]
+        | Event[dr.EventDeviceRegistryUpdatedData],
+    ) -> None:
+        """Invalidate permission results that looked up the registries."""
+        self._perm_lookup.registry_version += 1
+
     async def async_load(self) -> None:  # noqa: C901
         """Load the users."""
         if self._loaded:
@@ -308,6 +331,7 @@ class AuthStore:
 
         perm_lookup = PermissionLookup(ent_reg, dev_reg)
         self._perm_lookup = perm_lookup
+        self._async_track_registry_changes()
 
         if data is None or not isinstance(data, dict):
             self._set_defaults()
@@ -623,3 +647,25 @@ def _system_read_only_group() -> models.Group:
         policy=system_policies.READ_ONLY_POLICY,
         system_generated=True,
     )
+
+
+@callback
+def _entity_registry_changed_filter(
+    event_data: er.EventEntityRegistryUpdatedData,
+) -> bool:
+    """Filter entity registry events that can change permission lookups."""
+    return (
+        event_data["action"] != "update"
+        or "device_id" in event_data["changes"]
+        or "old_entity_id" in event_data
+    )
+
+
+@callback
+def _device_registry_changed_filter(
+    event_data: dr.EventDeviceRegistryUpdatedData,
+) -> bool:
+    """Filter device registry events that can change permission lookups."""
+    return event_data["action"] == "remove" or (
+        event_data["action"] == "update" and "area_id" in event_data["changes"]
+    )
@@ -7,7 +7,7 @@ from collections.abc import Callable
 import voluptuous as vol
 
 from .const import CAT_ENTITIES
-from .entities import ENTITY_POLICY_SCHEMA, compile_entities
+from .entities import ENTITY_POLICY_SCHEMA, compile_entities, entities_use_registries
 from .merge import merge_policies
 from .models import PermissionLookup
 from .types import PolicyType
@@ -54,6 +54,27 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        # Results of entity checks by key and entity id. Only policies that
+        # look up devices or areas need to drop them when registries change.
+        self._entity_results: dict[str, dict[str, bool]] = {}
+        self._registry_version: int | None = None
+        if entities_use_registries(policy.get(CAT_ENTITIES)):
+            self._registry_version = perm_lookup.registry_version
+
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity."""
+        if (
+            self._registry_version is not None
+            and self._registry_version != self._perm_lookup.registry_version
+        ):
+            self._registry_version = self._perm_lookup.registry_version
+            self._entity_results.clear()
+
+        if (results := self._entity_results.get(key)) is None:
+            results = self._entity_results[key] = {}
+        if (allowed := results.get(entity_id)) is None:
+            allowed = results[entity_id] = super().check_entity(entity_id, key)
+        return allowed
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
@@ -87,6 +87,13 @@ def _lookup_entity_id(
     return entities_dict.get(entity_id)
 
 
+def entities_use_registries(policy: CategoryType) -> bool:
+    """Return if the policy looks up entities in the registries."""
+    return isinstance(policy, dict) and (
+        ENTITY_DEVICE_IDS in policy or ENTITY_AREAS in policy
+    )
+
+
 def compile_entities(
     policy: CategoryType, perm_lookup: PermissionLookup
 ) -> Callable[[str, str], bool]:
@@ -16,3 +16,5 @@ class PermissionLookup:
 
     entity_registry: er.EntityRegistry = attr.ib()
     device_registry: dr.DeviceRegistry = attr.ib()
+    # Incremented when registry changes may alter device or area lookups
+    registry_version: int = attr.ib(default=0)
@@ -5,6 +5,7 @@ from asyncio import shield, timeout
 from functools import lru_cache
 from http import HTTPStatus
 import logging
+import secrets
 from typing import Any
 
 from aiohttp import web
@@ -49,6 +50,7 @@ from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.json import json_dumps, json_fragment
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 
@@ -77,7 +79,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.http.register_view(APICoreStateView)
     hass.http.register_view(APIEventStream)
     hass.http.register_view(APIConfigView)
-    hass.http.register_view(APIStatesView)
+    hass.http.register_view(APIStatesView(hass))
     hass.http.register_view(APIEntityStateView)
     hass.http.register_view(APIEventListenersView)
     hass.http.register_view(APIEventView)
@@ -207,25 +209,67 @@ class APIStatesView(HomeAssistantView):
     url = URL_API_STATES
     name = "api:states"
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the states view."""
+        # The generation changes with every state change so it can be used
+        # as ETag, the random prefix keeps ETags unique across restarts
+        self._etag_prefix = secrets.token_hex(8)
+        self._generation = 0
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @ha.callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Bump the generation of the state machine."""
+        self._generation += 1
+
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
-        """Get current states."""
+        """Get current states.
+
+        States can be limited to one or more domains with the domain query
+        parameter and to states updated since a point in time with since.
+        """
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
+        etag = f"{self._etag_prefix}-{self._generation}-{user.id}"
+        if (if_none_match := request.if_none_match) and any(
+            tag.value == etag for tag in if_none_match
+        ):
+            response = web.Response(status=HTTPStatus.NOT_MODIFIED)
+            response.etag = etag
+            return response
+
+        if domains := request.query.getall("domain", None):
+            states = hass.states.async_all([domain.lower() for domain in domains])
+        else:
+            states = hass.states.async_all()
+        if (since_str := request.query.get("since")) is not None:
+            if (since := dt_util.parse_datetime(since_str)) is None:
+                return self.json_message(
+                    "Invalid since specified.", HTTPStatus.BAD_REQUEST
+                )
+            since_timestamp = dt_util.as_utc(since).timestamp()
+            states = [
+                state
+                for state in states
+                if state.last_updated_timestamp >= since_timestamp
+            ]
+
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            states_json = (state.as_dict_json for state in states)
         else:
             entity_perm = user.permissions.check_entity
-            states = (
+            states_json = (
                 state.as_dict_json
-                for state in hass.states.async_all()
+                for state in states
                 if entity_perm(state.entity_id, "read")
             )
         response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
+            body=b"".join((b"[", b",".join(states_json), b"]")),
             content_type=CONTENT_TYPE_JSON,
             zlib_executor_size=32768,
         )
+        response.etag = etag
         response.enable_compression()
         return response
 
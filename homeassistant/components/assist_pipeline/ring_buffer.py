@@ -31,27 +31,31 @@ class RingBuffer:
     def put(self, data: bytes) -> None:
         """Put a chunk of data into the buffer, possibly wrapping around."""
         data_len = len(data)
-        new_pos = self._pos + data_len
-        if new_pos >= self._maxlen:
+        new_pos = (self._pos + data_len) % self._maxlen
+        view = memoryview(data)
+        if data_len > self._maxlen:
+            # Only the end of the data fits
+            view = view[data_len - self._maxlen :]
+        pos = (new_pos - len(view)) % self._maxlen
+        end = pos + len(view)
+        if end > self._maxlen:
             # Split into two chunks
-            num_bytes_1 = self._maxlen - self._pos
-            num_bytes_2 = new_pos - self._maxlen
-
-            self._buffer[self._pos : self._maxlen] = data[:num_bytes_1]
-            self._buffer[:num_bytes_2] = data[num_bytes_1:]
-            new_pos = new_pos - self._maxlen
+            num_bytes_1 = self._maxlen - pos
+            self._buffer[pos:] = view[:num_bytes_1]
+            self._buffer[: end - self._maxlen] = view[num_bytes_1:]
         else:
             # Entire chunk fits at current position
-            self._buffer[self._pos : self._pos + data_len] = data
+            self._buffer[pos:end] = view
 
         self._pos = new_pos
         self._length = min(self._maxlen, self._length + data_len)
 
     def getvalue(self) -> bytes:
         """Get bytes written to the buffer."""
-        if (self._pos + self._length) <= self._maxlen:
-            # Single chunk
-            return bytes(self._buffer[: self._length])
+        view = memoryview(self._buffer)
+        if self._length < self._maxlen:
+            # Buffer has not wrapped around yet
+            return bytes(view[: self._length])
 
-        # Two chunks
-        return bytes(self._buffer[self._pos :] + self._buffer[: self._pos])
+        # Two chunks, copied once into the result
+        return b"".join((view[self._pos :], view[: self._pos]))
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Final, cast
@@ -11,6 +11,11 @@ from typing import Final, cast
 _SAMPLE_RATE: Final = 16000  # Hz
 _SAMPLE_WIDTH: Final = 2  # bytes
 
+# Chunks with a lower RMS are treated as silence without running the VAD.
+# This only catches digital silence, e.g. from muted microphones, so the
+# result for real audio is unchanged.
+_SILENCE_RMS: Final = 1
+
 
 class VadSensitivity(StrEnum):
     """How quickly the end of a voice command is detected."""
@@ -39,6 +44,14 @@ class VoiceActivityDetector(ABC):
     def is_speech(self, chunk: bytes) -> bool:
         """Return True if audio chunk contains speech."""
 
+    def is_speech_chunks(self, chunks: Iterable[bytes]) -> Iterator[bool]:
+        """Yield for each audio chunk if it contains speech.
+
+        Chunks are only read and checked when the next result is requested.
+        """
+        for chunk in chunks:
+            yield self.is_speech(chunk)
+
     @property
     @abstractmethod
     def samples_per_chunk(self) -> int | None:
@@ -56,14 +69,29 @@ class WebRtcVad(VoiceActivityDetector):
         # pylint: disable=import-outside-toplevel
         from webrtc_noise_gain import AudioProcessor
 
+        # pylint: disable-next=import-outside-toplevel
+        import numpy as np
+
         # Just VAD: no noise suppression or auto gain
         self._audio_processor = AudioProcessor(0, 0)
+        self._np = np
 
     def is_speech(self, chunk: bytes) -> bool:
         """Return True if audio chunk contains speech."""
         result = self._audio_processor.Process10ms(chunk)
         return cast(bool, result.is_speech)
 
+    def is_speech_chunks(self, chunks: Iterable[bytes]) -> Iterator[bool]:
+        """Yield for each 10 ms audio chunk if it contains speech.
+
+        Silent chunks skip the VAD.
+        """
+        np = self._np
+        for chunk in chunks:
+            samples = np.frombuffer(chunk, dtype=np.int16)
+            mean_square = np.square(samples, dtype=np.float32).mean()
+            yield bool(mean_square >= _SILENCE_RMS**2) and self.is_speech(chunk)
+
     @property
     def samples_per_chunk(self) -> int | None:
         """Return 10 ms."""
@@ -87,7 +115,7 @@ class AudioBuffer:
         """Clear the buffer."""
         self._length = 0
 
-    def append(self, data: bytes) -> None:
+    def append(self, data: bytes | memoryview) -> None:
         """Append bytes to the buffer, increasing the internal length."""
         data_len = len(data)
         if (self._length + data_len) > len(self._buffer):
@@ -98,7 +126,7 @@ class AudioBuffer:
 
     def bytes(self) -> bytes:
         """Convert written portion of buffer to bytes."""
-        return bytes(self._buffer[: self._length])
+        return bytes(memoryview(self._buffer)[: self._length])
 
     def __len__(self) -> int:
         """Get the number of bytes currently in the buffer."""
@@ -212,8 +240,9 @@ class VoiceCommandSegmenter:
         # With chunking
         seconds_per_chunk = vad.samples_per_chunk / _SAMPLE_RATE
         bytes_per_chunk = vad.samples_per_chunk * _SAMPLE_WIDTH
-        for vad_chunk in chunk_samples(chunk, bytes_per_chunk, leftover_chunk_buffer):
-            is_speech = vad.is_speech(vad_chunk)
+        for is_speech in vad.is_speech_chunks(
+            chunk_samples(chunk, bytes_per_chunk, leftover_chunk_buffer)
+        ):
             if not self.process(seconds_per_chunk, is_speech):
                 return False
 
@@ -285,11 +314,13 @@ def chunk_samples(
         return
 
     next_chunk_idx = 0
+    # Copy into the leftover buffer without slicing the samples
+    samples_view = memoryview(samples)
 
     if leftover_chunk_buffer:
         # Add to leftover chunk from previous call(s).
         bytes_to_copy = bytes_per_chunk - len(leftover_chunk_buffer)
-        leftover_chunk_buffer.append(samples[:bytes_to_copy])
+        leftover_chunk_buffer.append(samples_view[:bytes_to_copy])
         next_chunk_idx = bytes_to_copy
 
         # Process full chunk in buffer
@@ -302,5 +333,5 @@ def chunk_samples(
         next_chunk_idx += bytes_per_chunk
 
     # Capture leftover chunks
-    if rest_samples := samples[next_chunk_idx:]:
+    if rest_samples := samples_view[next_chunk_idx:]:
         leftover_chunk_buffer.append(rest_samples)
@@ -159,6 +159,11 @@ class BluetoothMatcherIndexBase[
 
     This is optimized for cases when no service infos will be matched in
     any bucket and we can quickly reject the service info as not matching.
+
+    Manufacturer id matchers with a manufacturer_data_start are further
+    indexed by the first byte of the manufacturer data, since some
+    manufacturers (Apple) send many different types of advertisements
+    and only a few of them are of interest.
     """
 
     __slots__ = (
@@ -166,6 +171,7 @@ class BluetoothMatcherIndexBase[
         "service_uuid",
         "service_data_uuid",
         "manufacturer_id",
+        "manufacturer_data_start",
         "service_uuid_set",
         "service_data_uuid_set",
         "manufacturer_id_set",
@@ -177,6 +183,7 @@ class BluetoothMatcherIndexBase[
         self.service_uuid: dict[str, list[_T]] = {}
         self.service_data_uuid: dict[str, list[_T]] = {}
         self.manufacturer_id: dict[int, list[_T]] = {}
+        self.manufacturer_data_start: dict[int, dict[int, list[_T]]] = {}
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
@@ -197,6 +204,11 @@ class BluetoothMatcherIndexBase[
 
         # Manufacturer data is 2nd cheapest since its all ints
         if MANUFACTURER_ID in matcher:
+            if manufacturer_data_start := matcher.get(MANUFACTURER_DATA_START):
+                self.manufacturer_data_start.setdefault(
+                    matcher[MANUFACTURER_ID], {}
+                ).setdefault(manufacturer_data_start[0], []).append(matcher)
+                return True
             self.manufacturer_id.setdefault(matcher[MANUFACTURER_ID], []).append(
                 matcher
             )
@@ -227,6 +239,11 @@ class BluetoothMatcherIndexBase[
             return True
 
         if MANUFACTURER_ID in matcher:
+            if manufacturer_data_start := matcher.get(MANUFACTURER_DATA_START):
+                self.manufacturer_data_start[matcher[MANUFACTURER_ID]][
+                    manufacturer_data_start[0]
+                ].remove(matcher)
+                return True
             self.manufacturer_id[matcher[MANUFACTURER_ID]].remove(matcher)
             return True
 
@@ -244,7 +261,9 @@ class BluetoothMatcherIndexBase[
         """Rebuild the index sets."""
         self.service_uuid_set = set(self.service_uuid)
         self.service_data_uuid_set = set(self.service_data_uuid)
-        self.manufacturer_id_set = set(self.manufacturer_id)
+        self.manufacturer_id_set = set(self.manufacturer_id).union(
+            self.manufacturer_data_start
+        )
 
     def match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
         """Check for a match."""
@@ -270,15 +289,34 @@ class BluetoothMatcherIndexBase[
                 if ble_device_matches(matcher, service_info)
             )
 
-        if self.manufacturer_id_set and service_info.manufacturer_data:
-            matches.extend(
-                matcher
-                for manufacturer_id in self.manufacturer_id_set.intersection(
-                    service_info.manufacturer_data
-                )
-                for matcher in self.manufacturer_id[manufacturer_id]
-                if ble_device_matches(matcher, service_info)
-            )
+        if self.manufacturer_id_set and (
+            manufacturer_data := service_info.manufacturer_data
+        ):
+            for manufacturer_id in self.manufacturer_id_set.intersection(
+                manufacturer_data
+            ):
+                if manufacturer_id_matchers := self.manufacturer_id.get(
+                    manufacturer_id
+                ):
+                    matches.extend(
+                        matcher
+                        for matcher in manufacturer_id_matchers
+                        if ble_device_matches(matcher, service_info)
+                    )
+                if (
+                    (
+                        data_start_matchers := self.manufacturer_data_start.get(
+                            manufacturer_id
+                        )
+                    )
+                    and (data := manufacturer_data[manufacturer_id])
+                    and (first_byte_matchers := data_start_matchers.get(data[0]))
+                ):
+                    matches.extend(
+                        matcher
+                        for matcher in first_byte_matchers
+                        if ble_device_matches(matcher, service_info)
+                    )
 
         if self.service_uuid_set and service_info.service_uuids:
             matches.extend(
@@ -359,9 +397,12 @@ class BluetoothCallbackMatcherIndex(
     ) -> list[BluetoothCallbackMatcherWithCallback]:
         """Check for a match."""
         matches = self.match(service_info)
-        for matcher in self.address.get(service_info.address, []):
-            if ble_device_matches(matcher, service_info):
-                matches.append(matcher)
+        if address_matchers := self.address.get(service_info.address):
+            matches.extend(
+                matcher
+                for matcher in address_matchers
+                if ble_device_matches(matcher, service_info)
+            )
         for matcher in self.connectable:
             if ble_device_matches(matcher, service_info):
                 matches.append(matcher)
@@ -298,6 +298,16 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         super().__init__(hass, logger, address, mode, connectable)
         self._processors: list[PassiveBluetoothDataProcessor[Any, _DataT]] = []
         self._update_method = update_method
+        self._last_payload: (
+            tuple[
+                tuple[tuple[int, bytes], ...],
+                tuple[tuple[str, bytes], ...],
+                tuple[str, ...],
+                str,
+            ]
+            | None
+        ) = None
+        self._last_service_info: BluetoothServiceInfoBleak | None = None
         self.last_update_success = True
         self.restore_data: dict[str, RestoredPassiveBluetoothDataUpdate] = {}
         self.restore_key = None
@@ -310,6 +320,13 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         """Return if the device is available."""
         return self._available and self.last_update_success
 
+    @property
+    def rssi(self) -> int | None:
+        """Return the rssi of the last advertisement."""
+        if service_info := self._last_service_info:
+            return service_info.rssi
+        return None
+
     @callback
     def async_get_restore_data(
         self,
@@ -333,6 +350,9 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         # in the future, but is optional for now to allow
         # for a transition period.
         processor.async_register_coordinator(self, entity_description_class)
+        # Make sure the new processor sees the next advertisement
+        # even if the payload has not changed since the last one.
+        self._last_payload = None
 
         @callback
         def remove_processor() -> None:
@@ -353,6 +373,7 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
     ) -> None:
         """Handle the device going unavailable."""
         super()._async_handle_unavailable(service_info)
+        self._last_payload = None
         for processor in self._processors:
             processor.async_handle_unavailable()
 
@@ -368,6 +389,23 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         if self.hass.is_stopping:
             return
 
+        self._last_service_info = service_info
+
+        # The manager already drops advertisements that are identical to the
+        # previous one it has seen for the address, but the same payload can
+        # still be dispatched again when the device switches scanners. Only
+        # the rssi and last seen time are updated for an unchanged payload.
+        # The fingerprint is an immutable copy since the dicts may be mutated.
+        payload = (
+            tuple(service_info.manufacturer_data.items()),
+            tuple(service_info.service_data.items()),
+            tuple(service_info.service_uuids),
+            service_info.name,
+        )
+        if was_available and self.last_update_success and payload == self._last_payload:
+            return
+        self._last_payload = payload
+
         try:
             update = self._update_method(service_info)
         except Exception:
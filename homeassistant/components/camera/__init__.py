@@ -185,6 +185,8 @@ async def _async_get_image(
                 )
                 if camera.use_stream_for_stills
                 else await camera.async_camera_image(width=width, height=height)
+                if width is not None or height is not None
+                else await camera.async_get_frame()
             )
             if image_bytes:
                 content_type = camera.content_type
@@ -510,6 +512,10 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self._frame: bytes | None = None
+        self._frame_time = 0.0
+        self._frame_task: asyncio.Task[bytes | None] | None = None
+        self._frame_subscribers = 0
 
     @cached_property
     def entity_picture(self) -> str:
@@ -656,13 +662,50 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             partial(self.camera_image, width=width, height=height)
         )
 
+    @final
+    async def async_get_frame(self) -> bytes | None:
+        """Return the latest camera image shared by all consumers.
+
+        Concurrent requests wait for the same fetch from the camera. While
+        MJPEG streams are running the camera is asked for a new image at
+        most once per frame_interval and images fetched less than
+        frame_interval ago are served from memory.
+        """
+        if (
+            self._frame_subscribers
+            and self._frame is not None
+            and time.monotonic() - self._frame_time < self.frame_interval
+        ):
+            return self._frame
+        if (task := self._frame_task) is None or task.done():
+            task = self._frame_task = self.hass.async_create_task(
+                self._async_fetch_frame(), f"camera {self.entity_id} frame"
+            )
+        # Shield the fetch so a client going away does
+        # not cancel it for the other consumers
+        return await asyncio.shield(task)
+
+    async def _async_fetch_frame(self) -> bytes | None:
+        """Fetch a new camera image for async_get_frame."""
+        frame = await self.async_camera_image()
+        self._frame = frame
+        self._frame_time = time.monotonic()
+        return frame
+
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
         """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        self._frame_subscribers += 1
+        try:
+            return await async_get_still_stream(
+                request, self.async_get_frame, self.content_type, interval
+            )
+        finally:
+            self._frame_subscribers -= 1
+            if not self._frame_subscribers:
+                # Nobody is watching, drop the frame
+                self._frame = None
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -746,6 +789,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Update the used token."""
         self.access_tokens.append(hex(_RND.getrandbits(256))[2:])
         self.__dict__.pop("entity_picture", None)
+        self._async_invalidate_static_state_attributes()
 
     async def async_internal_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -1008,7 +1052,7 @@ async def async_handle_snapshot_service(
         image = (
             await _async_get_stream_image(camera, wait_for_next_keyframe=True)
             if camera.use_stream_for_stills
-            else await camera.async_camera_image()
+            else await camera.async_get_frame()
         )
 
     if image is None:
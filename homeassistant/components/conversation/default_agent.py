@@ -5,35 +5,50 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 from collections.abc import Awaitable, Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import functools
 import logging
 from pathlib import Path
 import re
 from typing import IO, Any
 
-from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.expression import (
+    Expression,
+    ListReference,
+    Sequence,
+    SequenceType,
+    TextChunk,
+)
+from hassil.intents import (
+    Intent,
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
+    PUNCTUATION,
+    WHITESPACE,
     RecognizeResult,
     UnmatchedTextEntity,
     recognize_all,
 )
-from hassil.util import merge_dict
+from hassil.util import merge_dict, normalize_text
 from home_assistant_intents import ErrorKey, get_intents, get_languages
 import yaml
 
 from homeassistant import core
 from homeassistant.components.homeassistant.exposed_entities import (
-    async_listen_entity_updates,
+    ExposedEntityInfo,
+    async_get_exposed_entities_snapshot,
     async_should_expose,
 )
-from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
+from homeassistant.const import MATCH_ALL
 from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
-    entity_registry as er,
     floor_registry as fr,
     intent,
     start,
@@ -50,9 +65,9 @@ from .models import ConversationInput, ConversationResult
 
 _LOGGER = logging.getLogger(__name__)
 _DEFAULT_ERROR_TEXT = "Sorry, I couldn't understand that"
-_ENTITY_REGISTRY_UPDATE_FIELDS = ["aliases", "name", "original_name"]
 
 REGEX_TYPE = type(re.compile(""))
+_WORD_PATTERN = re.compile(r"\w+")
 TRIGGER_CALLBACK_TYPE = Callable[
     [str, RecognizeResult, str | None], Awaitable[str | None]
 ]
@@ -82,6 +97,41 @@ class LanguageIntents:
     intent_responses: dict[str, Any]
     error_responses: dict[str, Any]
     language_variant: str | None
+    intents_index: WordIndex | None = None
+
+
+class WordIndex:
+    """Index of the words that input text must contain to match an item.
+
+    Items are intent data blocks or slot list values. Each item has one or
+    more alternatives (e.g. sentence templates) and can only be matched by
+    text containing every required word of one of them. Words are checked as
+    substrings of the text, so "light" is still found in "lights" and a
+    possible match is never ruled out.
+    """
+
+    __slots__ = ("_item_words", "_words")
+
+    def __init__(self, item_words: list[list[frozenset[str]]]) -> None:
+        """Initialize the index."""
+        self._item_words = item_words
+        self._words = frozenset(
+            word
+            for alternatives in item_words
+            for required_words in alternatives
+            for word in required_words
+        )
+
+    def matches(self, text: str) -> list[bool]:
+        """Return for each item if text may match it.
+
+        Text must be normalized with _normalize_index_text.
+        """
+        present_words = {word for word in self._words if word in text}
+        return [
+            any(required_words <= present_words for required_words in alternatives)
+            for alternatives in self._item_words
+        ]
 
 
 @dataclass(slots=True)
@@ -159,58 +209,24 @@ class DefaultAgent(ConversationEntity):
         # intent -> [sentences]
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
+        self._slot_lists_index: dict[str, WordIndex] | None = None
+        self._slot_lists_version: int | None = None
+
+        # entity_id -> (info, name values, words of name values)
+        self._entity_names: dict[
+            str,
+            tuple[ExposedEntityInfo, list[TextSlotValue], list[frozenset[str]]],
+        ] = {}
 
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
-        self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
 
     @property
     def supported_languages(self) -> list[str]:
         """Return a list of supported languages."""
         return get_languages()
 
-    @core.callback
-    def _filter_entity_registry_changes(
-        self, event_data: er.EventEntityRegistryUpdatedData
-    ) -> bool:
-        """Filter entity registry changed events."""
-        return event_data["action"] == "update" and any(
-            field in event_data["changes"] for field in _ENTITY_REGISTRY_UPDATE_FIELDS
-        )
-
-    @core.callback
-    def _filter_state_changes(self, event_data: core.EventStateChangedData) -> bool:
-        """Filter state changed events."""
-        return not event_data["old_state"] or not event_data["new_state"]
-
-    @core.callback
-    def _listen_clear_slot_list(self) -> None:
-        """Listen for changes that can invalidate slot list."""
-        assert self._unsub_clear_slot_list is None
-
-        self._unsub_clear_slot_list = [
-            self.hass.bus.async_listen(
-                ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
-            ),
-            self.hass.bus.async_listen(
-                fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
-            ),
-            self.hass.bus.async_listen(
-                er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
-                event_filter=self._filter_entity_registry_changes,
-            ),
-            self.hass.bus.async_listen(
-                EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
-                event_filter=self._filter_state_changes,
-            ),
-            async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
-        ]
-
     async def async_recognize(
         self, user_input: ConversationInput
     ) -> RecognizeResult | SentenceTriggerResult | None:
@@ -241,6 +257,7 @@ class DefaultAgent(ConversationEntity):
             slot_lists,
             intent_context,
             language,
+            self._slot_lists_index,
         )
 
     async def async_process(self, user_input: ConversationInput) -> ConversationResult:
@@ -417,14 +434,24 @@ class DefaultAgent(ConversationEntity):
         slot_lists: dict[str, SlotList],
         intent_context: dict[str, Any] | None,
         language: str,
+        slot_lists_index: dict[str, WordIndex] | None = None,
     ) -> RecognizeResult | None:
         """Search intents for a match to user input."""
+        # Only match against sentences and names whose words are in the input
+        intents = lang_intents.intents
+        index_text = _normalize_index_text(user_input.text, intents)
+        if lang_intents.intents_index is not None:
+            intents = _prune_intents(intents, lang_intents.intents_index, index_text)
+
+        if slot_lists_index:
+            slot_lists = _prune_slot_lists(slot_lists, slot_lists_index, index_text)
+
         name_result: RecognizeResult | None = None
         best_results: list[RecognizeResult] = []
         best_text_chunks_matched: int | None = None
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            intents,
             slot_lists=slot_lists,
             intent_context=intent_context,
             language=language,
@@ -465,7 +492,7 @@ class DefaultAgent(ConversationEntity):
         maybe_result: RecognizeResult | None = None
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            intents,
             slot_lists=slot_lists,
             intent_context=intent_context,
             allow_unmatched_entities=True,
@@ -742,6 +769,7 @@ class DefaultAgent(ConversationEntity):
         # But it will likely only be called once anyways, unless new
         # components with sentences are often being loaded.
         intents = Intents.from_dict(intents_dict)
+        intents_index = _make_intents_index(intents)
 
         # Load responses
         responses_dict = intents_dict.get("responses", {})
@@ -755,72 +783,55 @@ class DefaultAgent(ConversationEntity):
                 intent_responses,
                 error_responses,
                 language_variant,
+                intents_index,
             )
             self._lang_intents[language] = lang_intents
         else:
             lang_intents.intents = intents
+            lang_intents.intents_index = intents_index
             lang_intents.intent_responses = intent_responses
             lang_intents.error_responses = error_responses
 
         return lang_intents
 
-    @core.callback
-    def _async_clear_slot_list(self, event: core.Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
-        self._slot_lists = None
-        assert self._unsub_clear_slot_list is not None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
-
     @core.callback
     def _make_slot_lists(self) -> dict[str, SlotList]:
         """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
+        snapshot = async_get_exposed_entities_snapshot(self.hass, DOMAIN)
+        if (
+            self._slot_lists is not None
+            and self._slot_lists_version == snapshot.version
+        ):
             return self._slot_lists
 
-        entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
-
         # Gather exposed entity names.
         #
         # NOTE: We do not pass entity ids in here because multiple entities may
         # have the same name. The intent matcher doesn't gather all matching
         # values for a list, just the first. So we will need to match by name no
         # matter what.
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            entity = entity_registry.async_get(state.entity_id)
-
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
-
-            if entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
-
-                    entity_names.append((alias, alias, context))
+        #
+        # Values are only rebuilt for entities that changed in the snapshot.
+        cached_names = {}
+        name_values: list[TextSlotValue] = []
+        name_words: list[list[frozenset[str]]] = []
+        for entity_id, info in snapshot.entities.items():
+            if (
+                cached := self._entity_names.get(entity_id)
+            ) is None or cached[0] is not info:
+                values = self._make_entity_name_values(info)
+                cached = (
+                    info,
+                    values,
+                    [_collect_required_words(value.text_in) for value in values],
+                )
 
-            # Default name
-            entity_names.append((state.name, state.name, context))
+            cached_names[entity_id] = cached
+            name_values.extend(cached[1])
+            name_words.extend([words] for words in cached[2])
 
-        _LOGGER.debug("Exposed entities: %s", entity_names)
+        self._entity_names = cached_names
+        _LOGGER.debug("Exposed entities: %s", list(cached_names))
 
         # Expose all areas.
         areas = ar.async_get(self.hass)
@@ -852,15 +863,45 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
+        area_list = TextSlotList.from_tuples(area_names, allow_template=False)
+        floor_list = TextSlotList.from_tuples(floor_names, allow_template=False)
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
-            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
+            "area": area_list,
+            "name": TextSlotList(values=name_values),
+            "floor": floor_list,
+        }
+        self._slot_lists_index = {
+            "area": _make_slot_list_index(area_list),
+            "name": WordIndex(name_words),
+            "floor": _make_slot_list_index(floor_list),
         }
+        self._slot_lists_version = snapshot.version
 
-        self._listen_clear_slot_list()
         return self._slot_lists
 
+    @core.callback
+    def _make_entity_name_values(
+        self, info: ExposedEntityInfo
+    ) -> list[TextSlotValue]:
+        """Create slot list values for the names and aliases of an entity."""
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": core.split_entity_id(info.entity_id)[0]}
+        if (state := self.hass.states.get(info.entity_id)) and state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
+
+        entity_names = [
+            (alias, alias, context) for alias in info.aliases if alias.strip()
+        ]
+
+        # Default name
+        entity_names.append((info.name, info.name, context))
+
+        return TextSlotList.from_tuples(entity_names, allow_template=False).values
+
     def _make_intent_context(
         self, user_input: ConversationInput
     ) -> dict[str, Any] | None:
@@ -1143,3 +1184,90 @@ def _collect_list_references(expression: Expression, list_names: set[str]) -> No
         # {list}
         list_ref: ListReference = expression
         list_names.add(list_ref.slot_name)
+
+
+def _collect_required_words(expression: Expression) -> frozenset[str]:
+    """Collect the words that any text matching an expression must contain."""
+    if isinstance(expression, TextChunk):
+        return frozenset(_WORD_PATTERN.findall(expression.text))
+
+    if isinstance(expression, Sequence):
+        item_words = [_collect_required_words(item) for item in expression.items]
+        if not item_words:
+            return frozenset()
+
+        if expression.type == SequenceType.GROUP:
+            # All items are matched
+            return frozenset().union(*item_words)
+
+        # Only one item is matched (optionals have an empty alternative)
+        return frozenset.intersection(*item_words)
+
+    # List and rule references can match any text
+    return frozenset()
+
+
+def _make_intents_index(intents: Intents) -> WordIndex:
+    """Index the words required by the sentences of each intent data block."""
+    return WordIndex(
+        [
+            list(
+                {
+                    _collect_required_words(sentence)
+                    for sentence in intent_data.sentences
+                }
+            )
+            for intent_obj in intents.intents.values()
+            for intent_data in intent_obj.data
+        ]
+    )
+
+
+def _make_slot_list_index(slot_list: TextSlotList) -> WordIndex:
+    """Index the words required by each value of a slot list."""
+    return WordIndex(
+        [[_collect_required_words(value.text_in)] for value in slot_list.values]
+    )
+
+
+def _normalize_index_text(text: str, intents: Intents) -> str:
+    """Normalize input text like hassil does before matching it."""
+    text = PUNCTUATION.sub("", normalize_text(text))
+    if intents.settings.ignore_whitespace:
+        text = WHITESPACE.sub("", text)
+
+    return text
+
+
+def _prune_intents(intents: Intents, index: WordIndex, text: str) -> Intents:
+    """Return intents with only the data blocks that text may match."""
+    matches = iter(index.matches(text))
+    pruned_intents: dict[str, Intent] = {}
+    for intent_name, intent_obj in intents.intents.items():
+        intent_data = [data for data in intent_obj.data if next(matches)]
+        if intent_data:
+            pruned_intents[intent_name] = replace(intent_obj, data=intent_data)
+
+    return replace(intents, intents=pruned_intents)
+
+
+def _prune_slot_lists(
+    slot_lists: dict[str, SlotList], index: dict[str, WordIndex], text: str
+) -> dict[str, SlotList]:
+    """Return slot lists with only the values that text may match."""
+    pruned_lists = dict(slot_lists)
+    for list_name, list_index in index.items():
+        slot_list = slot_lists[list_name]
+        assert isinstance(slot_list, TextSlotList)
+        pruned_lists[list_name] = replace(
+            slot_list,
+            values=[
+                value
+                for value, value_matches in zip(
+                    slot_list.values, list_index.matches(text), strict=True
+                )
+                if value_matches
+            ],
+        )
+
+    return pruned_lists
@@ -12,10 +12,23 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback, split_entity_id
+from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    floor_registry as fr,
+)
 from homeassistant.helpers.entity import get_device_class
 from homeassistant.helpers.storage import Store
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -93,6 +106,16 @@ class ExposedEntity:
         }
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class ExposedEntityInfo:
+    """Names and area of an entity exposed to an assistant."""
+
+    entity_id: str
+    name: str
+    aliases: list[str]
+    area_id: str | None
+
+
 class SerializedExposedEntities(TypedDict):
     """Serialized exposed entities storage storage collection."""
 
@@ -114,6 +137,7 @@ class ExposedEntities:
         """Initialize."""
         self._hass = hass
         self._listeners: dict[str, list[Callable[[], None]]] = {}
+        self._snapshots: dict[str, ExposedEntitiesSnapshot] = {}
         self._store: Store[SerializedExposedEntities] = Store(
             hass, STORAGE_VERSION, STORAGE_KEY
         )
@@ -140,6 +164,16 @@ class ExposedEntities:
 
         return unsubscribe
 
+    @callback
+    def async_get_snapshot(self, assistant: str) -> ExposedEntitiesSnapshot:
+        """Return the snapshot of entities exposed to an assistant."""
+        if (snapshot := self._snapshots.get(assistant)) is None:
+            snapshot = ExposedEntitiesSnapshot(self._hass, self, assistant)
+            snapshot.async_setup()
+            self._snapshots[assistant] = snapshot
+
+        return snapshot
+
     @callback
     def async_set_assistant_option(
         self, assistant: str, entity_id: str, key: str, value: Any
@@ -392,6 +426,149 @@ class ExposedEntities:
         }
 
 
+class ExposedEntitiesSnapshot:
+    """Entities exposed to an assistant with their names, aliases and areas.
+
+    The snapshot is built once and then updated per entity from state,
+    registry and expose setting changes. The version is increased on every
+    change, including area and floor changes, so that data derived from the
+    snapshot can be cached until the version changes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        exposed_entities: ExposedEntities,
+        assistant: str,
+    ) -> None:
+        """Initialize the snapshot."""
+        self._hass = hass
+        self._exposed_entities = exposed_entities
+        self._assistant = assistant
+        self.entities: dict[str, ExposedEntityInfo] = {}
+        self.version = 0
+
+    @callback
+    def async_setup(self) -> None:
+        """Build the snapshot and listen for changes."""
+        bus = self._hass.bus
+        bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._filter_state_changes,
+        )
+        bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+        bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_device_registry_updated,
+            event_filter=self._filter_device_registry_changes,
+        )
+        bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_bump_version)
+        bus.async_listen(fr.EVENT_FLOOR_REGISTRY_UPDATED, self._async_bump_version)
+        self._exposed_entities.async_listen_entity_updates(
+            self._assistant, self._async_rebuild
+        )
+        self._async_rebuild()
+
+    @callback
+    def _filter_state_changes(self, event_data: EventStateChangedData) -> bool:
+        """Filter state changes that add, remove or rename an entity."""
+        old_state = event_data["old_state"]
+        new_state = event_data["new_state"]
+        return (
+            old_state is None or new_state is None or old_state.name != new_state.name
+        )
+
+    @callback
+    def _filter_device_registry_changes(
+        self, event_data: dr.EventDeviceRegistryUpdatedData
+    ) -> bool:
+        """Filter device registry changes that move a device to another area."""
+        return event_data["action"] == "update" and "area_id" in event_data["changes"]
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update an entity that was added, removed or renamed."""
+        self._async_update_entity(event.data["entity_id"])
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Update an entity that changed in the entity registry."""
+        if event.data["action"] == "update" and "old_entity_id" in event.data:
+            self._async_update_entity(event.data["old_entity_id"])
+        self._async_update_entity(event.data["entity_id"])
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Update the entities of a device that changed area."""
+        entity_registry = er.async_get(self._hass)
+        for entity_entry in er.async_entries_for_device(
+            entity_registry, event.data["device_id"]
+        ):
+            self._async_update_entity(entity_entry.entity_id)
+
+    @callback
+    def _async_bump_version(self, event: Event[Any] | None = None) -> None:
+        """Mark the snapshot as changed."""
+        self.version += 1
+
+    @callback
+    def _async_rebuild(self) -> None:
+        """Rebuild the snapshot from all states."""
+        self.entities = {
+            state.entity_id: info
+            for state in self._hass.states.async_all()
+            if (info := self._async_get_entity_info(state)) is not None
+        }
+        self.version += 1
+
+    @callback
+    def _async_update_entity(self, entity_id: str) -> None:
+        """Update a single entity in the snapshot."""
+        info: ExposedEntityInfo | None = None
+        if (state := self._hass.states.get(entity_id)) is not None:
+            info = self._async_get_entity_info(state)
+
+        if info == self.entities.get(entity_id):
+            return
+
+        if info is None:
+            del self.entities[entity_id]
+        else:
+            self.entities[entity_id] = info
+        self.version += 1
+
+    @callback
+    def _async_get_entity_info(self, state: State) -> ExposedEntityInfo | None:
+        """Return the info of an entity if it is exposed."""
+        entity_id = state.entity_id
+        if not self._exposed_entities.async_should_expose(self._assistant, entity_id):
+            return None
+
+        entity_registry = er.async_get(self._hass)
+        if (entity_entry := entity_registry.async_get(entity_id)) is None:
+            return ExposedEntityInfo(entity_id, state.name, [], None)
+
+        area_id = entity_entry.area_id
+        if (
+            area_id is None
+            and entity_entry.device_id
+            and (device := dr.async_get(self._hass).async_get(entity_entry.device_id))
+        ):
+            # Use device area
+            area_id = device.area_id
+
+        return ExposedEntityInfo(
+            entity_id, state.name, list(entity_entry.aliases), area_id
+        )
+
+
 @callback
 @websocket_api.require_admin
 @websocket_api.websocket_command(
@@ -544,3 +721,12 @@ def async_set_assistant_option(
     """
     exposed_entities: ExposedEntities = hass.data[DATA_EXPOSED_ENTITIES]
     exposed_entities.async_set_assistant_option(assistant, entity_id, option, value)
+
+
+@callback
+def async_get_exposed_entities_snapshot(
+    hass: HomeAssistant, assistant: str
+) -> ExposedEntitiesSnapshot:
+    """Get the snapshot of entities exposed to an assistant."""
+    exposed_entities: ExposedEntities = hass.data[DATA_EXPOSED_ENTITIES]
+    return exposed_entities.async_get_snapshot(assistant)
@@ -80,6 +80,7 @@ class HomeKitEntity(Entity):
         """Clear the cache of properties."""
         for prop in properties:
             self.__dict__.pop(prop, None)
+        self._async_invalidate_static_state_attributes()
 
     @callback
     def _async_reconfigure(self) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import suppress
@@ -215,6 +216,8 @@ class IpBanManager:
         self.hass = hass
         self.path = hass.config.path(IP_BANS_FILE)
         self.ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        self._pending_bans: list[IpBan] = []
+        self._write_lock = asyncio.Lock()
 
     async def async_load(self) -> None:
         """Load the existing IP bans."""
@@ -240,17 +243,26 @@ class IpBanManager:
 
         self.ip_bans_lookup = ip_bans_lookup
 
-    def _add_ban(self, ip_ban: IpBan) -> None:
-        """Update config file with new banned IP address."""
+    def _add_bans(self, ip_bans: list[IpBan]) -> None:
+        """Update config file with new banned IP addresses."""
         with open(self.path, "a", encoding="utf8") as out:
             ip_ = {
                 str(ip_ban.ip_address): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}
+                for ip_ban in ip_bans
             }
             # Write in a single write call to avoid interleaved writes
             out.write("\n" + yaml.dump(ip_))
 
     async def async_add_ban(self, remote_addr: IPv4Address | IPv6Address) -> None:
         """Add a new IP address to the banned list."""
-        if remote_addr not in self.ip_bans_lookup:
-            new_ban = self.ip_bans_lookup[remote_addr] = IpBan(remote_addr)
-            await self.hass.async_add_executor_job(self._add_ban, new_ban)
+        if remote_addr in self.ip_bans_lookup:
+            return
+        new_ban = self.ip_bans_lookup[remote_addr] = IpBan(remote_addr)
+        self._pending_bans.append(new_ban)
+        # Bans added while a write is in progress are written together
+        # by the next write instead of each opening the file on their own
+        async with self._write_lock:
+            if not (ip_bans := self._pending_bans):
+                return
+            self._pending_bans = []
+            await self.hass.async_add_executor_job(self._add_bans, ip_bans)
@@ -3,22 +3,31 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from contextlib import suppress
+from http import HTTPStatus
 import mimetypes
 from pathlib import Path
+import time
 from typing import Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.helpers import ETag
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
+from homeassistant.core import HomeAssistant
+
 from .const import KEY_HASS
 
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {hdrs.CACHE_CONTROL: CACHE_HEADER}
 PATH_CACHE: LRU[tuple[str, Path], tuple[Path | None, str | None]] = LRU(512)
+# How long the ETags of a file are trusted before the file is checked again
+ETAG_CACHE_TIME: Final = 60  # seconds
+ETAG_CACHE: LRU[Path, tuple[float, tuple[str, ...]]] = LRU(512)
 
 
 def _get_file_path(rel_url: str, directory: Path) -> Path | None:
@@ -39,6 +48,30 @@ def _get_file_path(rel_url: str, directory: Path) -> Path | None:
     raise FileNotFoundError
 
 
+def _get_file_etags(filepath: Path) -> tuple[str, ...]:
+    """Return the ETags FileResponse sends for a file and its gzip variant."""
+    etags: list[str] = []
+    for path in (filepath, filepath.with_name(f"{filepath.name}.gz")):
+        with suppress(OSError):
+            st = path.stat()
+            etags.append(f"{st.st_mtime_ns:x}-{st.st_size:x}")
+    return tuple(etags)
+
+
+async def _async_match_etag(
+    hass: HomeAssistant, filepath: Path, if_none_match: tuple[ETag, ...]
+) -> str | None:
+    """Return the ETag of the file the client already has, if any."""
+    now = time.monotonic()
+    if (cached := ETAG_CACHE.get(filepath)) is None or cached[0] < now:
+        etags = await hass.async_add_executor_job(_get_file_etags, filepath)
+        cached = ETAG_CACHE[filepath] = (now + ETAG_CACHE_TIME, etags)
+    for etag in if_none_match:
+        if not etag.is_weak and etag.value in cached[1]:
+            return etag.value
+    return None
+
+
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
@@ -71,6 +104,17 @@ class CachingStaticResource(StaticResource):
             filepath, content_type = filepath_content_type
 
         if filepath and content_type:
+            # Clients revalidating a file they already have are answered
+            # from the cached ETags instead of stating the file again
+            if (if_none_match := request.if_none_match) and (
+                etag := await _async_match_etag(
+                    request.app[KEY_HASS], filepath, if_none_match
+                )
+            ):
+                return Response(
+                    status=HTTPStatus.NOT_MODIFIED,
+                    headers={hdrs.CACHE_CONTROL: CACHE_HEADER, hdrs.ETAG: f'"{etag}"'},
+                )
             return FileResponse(
                 filepath,
                 chunk_size=self._chunk_size,
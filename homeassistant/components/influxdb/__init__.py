@@ -7,6 +7,7 @@ from contextlib import suppress
 from dataclasses import dataclass
 import logging
 import math
+import os
 import queue
 import threading
 import time
@@ -47,7 +48,10 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_VERSION_2,
@@ -92,10 +96,16 @@ from .const import (
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_ERROR_MESSAGE,
+    SPOOL_FILE,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_SIZE,
+    SPOOL_REJECTED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
@@ -493,7 +503,10 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = InfluxSpool(hass.config.path(STORAGE_DIR, SPOOL_FILE), SPOOL_MAX_SIZE)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -507,10 +520,78 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+class InfluxSpool:
+    """Size capped file of events that could not be written to Influx.
+
+    Each failed batch is appended as one line, so replaying the file returns
+    the events in the order they were recorded. The file is only read once,
+    after that the spooled events are kept in memory.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_size = max_size
+        self.size = 0
+        self._events: list[dict[str, Any]] | None = None
+
+    def load(self) -> None:
+        """Pick up events spooled before the last restart."""
+        try:
+            self.size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            self.size = 0
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR_MESSAGE, self.path, err)
+            self.size = 0
+
+    def append(self, json: list[dict[str, Any]]) -> bool:
+        """Append a batch of events, return False if it could not be spooled."""
+        line = json_bytes(json) + b"\n"
+        if self.size + len(line) > self.max_size:
+            return False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "ab") as file:
+                file.write(line)
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR_MESSAGE, self.path, err)
+            return False
+        self.size += len(line)
+        if self._events is not None:
+            self._events.extend(json)
+        return True
+
+    def read(self) -> list[dict[str, Any]]:
+        """Return all spooled events in the order they were appended."""
+        if self._events is not None:
+            return self._events
+        try:
+            with open(self.path, "rb") as file:
+                lines = file.read().splitlines()
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR_MESSAGE, self.path, err)
+            return []
+        json: list[dict[str, Any]] = []
+        for line in lines:
+            # A batch cut short by a crash while appending is skipped
+            with suppress(ValueError):
+                json.extend(json_loads(line))
+        self._events = json
+        return json
+
+    def clear(self) -> None:
+        """Remove all spooled events."""
+        with suppress(FileNotFoundError):
+            os.remove(self.path)
+        self.size = 0
+        self._events = []
+
+
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_json, max_tries, spool):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
@@ -519,6 +600,7 @@ class InfluxThread(threading.Thread):
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool = spool
         self.write_errors = 0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
@@ -569,30 +651,63 @@ class InfluxThread(threading.Thread):
         return count, json
 
     def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        """Write preprocessed events to influxdb, with retry.
+
+        Events spooled by earlier failed writes are replayed ahead of the new
+        ones and batches that still fail after retrying are added to the spool.
+        """
+        if self.spool.size and not self._write_with_retry(self.spool.read(), True):
+            # Keep the order, the new events can only follow the spooled ones
+            self._spool_events(json)
+            return
+
+        if not self._write_with_retry(json, False):
+            self._spool_events(json)
+
+    def _write_with_retry(self, json, spooled):
+        """Write events, return False if Influx could not be reached."""
         for retry in range(self.max_tries + 1):
             try:
                 self.influx.write(json)
-
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
-
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
-                break
             except ValueError as err:
-                _LOGGER.error(err)
-                break
+                # Influx stores the valid points of a partial write and only
+                # drops the ones it rejected
+                if spooled:
+                    _LOGGER.error(SPOOL_REJECTED_MESSAGE, len(json), err)
+                    self.spool.clear()
+                else:
+                    _LOGGER.error(err)
+                return True
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
-                else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    continue
+                if not self.spool.size and not self.write_errors:
+                    _LOGGER.error(err)
+                return False
+
+            if spooled:
+                self.spool.clear()
+                _LOGGER.info(REPLAYED_MESSAGE, len(json))
+
+            if self.write_errors:
+                _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                self.write_errors = 0
+
+            _LOGGER.debug(WROTE_MESSAGE, len(json))
+            return True
+        return False
+
+    def _spool_events(self, json):
+        """Add events to the spool, count them as lost if it is full."""
+        if not self.spool.append(json):
+            if not self.write_errors:
+                _LOGGER.warning(SPOOL_FULL_MESSAGE, len(json))
+            self.write_errors += len(json)
 
     def run(self):
         """Process incoming events."""
+        self.spool.load()
         while not self.shutdown:
             _, json = self.get_events_json()
             if json:
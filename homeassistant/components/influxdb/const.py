@@ -78,6 +78,8 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+SPOOL_FILE = "influxdb_spool"
+SPOOL_MAX_SIZE = 4 * 1024 * 1024  # bytes
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -119,6 +121,12 @@ QUERY_ERROR = (
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
+REPLAYED_MESSAGE = "Resumed, replayed %d spooled events."
+SPOOL_FULL_MESSAGE = "Spool is full, dropped %d events."
+SPOOL_REJECTED_MESSAGE = (
+    "Replayed %d spooled events, InfluxDB rejected some of them: %s"
+)
+SPOOL_ERROR_MESSAGE = "Could not access spool file %s: %s"
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
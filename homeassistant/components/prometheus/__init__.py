@@ -4,13 +4,16 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from contextlib import suppress
+import gzip
 import logging
 import string
 from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
+from prometheus_client.exposition import choose_encoder, gzip_accepted
 from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.registry import CollectorRegistry
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -26,7 +29,7 @@ from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
 )
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES, ATTR_HUMIDITY
 from homeassistant.components.light import ATTR_BRIGHTNESS
 from homeassistant.components.sensor import SensorDeviceClass
@@ -49,7 +52,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import (
@@ -65,6 +74,10 @@ _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
 
+# Number of different exposition requests (format, filter) to cache
+MAX_CACHED_EXPOSITIONS = 8
+OPENMETRICS_EOF = b"# EOF\n"
+
 DOMAIN = "prometheus"
 CONF_FILTER = "filter"
 CONF_REQUIRES_AUTH = "requires_auth"
@@ -107,8 +120,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -122,6 +133,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     metrics = PrometheusMetrics(
+        hass,
         entity_filter,
         namespace,
         climate_units,
@@ -130,6 +142,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
@@ -148,6 +161,7 @@ class PrometheusMetrics:
 
     def __init__(
         self,
+        hass: HomeAssistant,
         entity_filter: entityfilter.EntityFilter,
         namespace: str,
         climate_units: UnitOfTemperature,
@@ -156,6 +170,7 @@ class PrometheusMetrics:
         default_metric: str | None,
     ) -> None:
         """Initialize Prometheus Metrics."""
+        self._hass = hass
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -176,7 +191,25 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
+        # Entity metrics are kept apart from the process, platform and GC
+        # collectors of the default registry so they can be cached
+        self.registry = CollectorRegistry(auto_describe=True)
         self._climate_units = climate_units
+        # Increased on the event loop after every change of the entity metrics
+        self.version = 0
+
+    @callback
+    def _async_increase_version(self) -> None:
+        """Mark the entity metrics as changed."""
+        self.version += 1
+
+    def _metrics_changed(self) -> None:
+        """Mark the entity metrics as changed from any thread.
+
+        State listeners run in the executor, the version is only changed
+        on the event loop once the metrics are updated.
+        """
+        self._hass.loop.call_soon_threadsafe(self._async_increase_version)
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
         """Handle new messages from the bus."""
@@ -226,6 +259,7 @@ class PrometheusMetrics:
             "The last_updated timestamp",
         )
         last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+        self._metrics_changed()
 
     def handle_entity_registry_updated(
         self, event: Event[EventEntityRegistryUpdatedData]
@@ -270,6 +304,7 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+        self._metrics_changed()
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -306,7 +341,7 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=self.registry,
             )
             return cast(_MetricBaseT, self._metrics[metric])
 
@@ -721,15 +756,70 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, metrics: PrometheusMetrics) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._metrics = metrics
+        # (content type, metric names) -> (metrics version, entity metrics)
+        self._cache: dict[tuple[str, tuple[str, ...]], tuple[int, bytes]] = {}
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+        encoder, content_type = choose_encoder(request.headers.get(hdrs.ACCEPT, ""))
+        if content_type == prometheus_client.CONTENT_TYPE_LATEST:
+            content_type = CONTENT_TYPE_TEXT_PLAIN
+        names = tuple(sorted(request.query.getall("name[]", [])))
+        use_gzip = gzip_accepted(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+
+        # Entity metrics are only rendered again if they changed since the
+        # last request, the process, platform and GC metrics are always live
+        key = (content_type, names)
+        version = self._metrics.version
+        entity_body: bytes | None = None
+        if (cached := self._cache.get(key)) is not None and cached[0] == version:
+            entity_body = cached[1]
+        body, entity_body = await request.app[KEY_HASS].async_add_executor_job(
+            _generate_exposition,
+            encoder,
+            self._metrics.registry,
+            entity_body,
+            names,
+            use_gzip,
+        )
+        if key not in self._cache and len(self._cache) >= MAX_CACHED_EXPOSITIONS:
+            self._cache.clear()
+        self._cache[key] = (version, entity_body)
+
+        headers = {hdrs.CONTENT_TYPE: content_type}
+        if use_gzip:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        return web.Response(body=body, headers=headers)
+
+
+def _generate_exposition(
+    encoder: Callable[[CollectorRegistry], bytes],
+    entity_registry: CollectorRegistry,
+    entity_body: bytes | None,
+    names: tuple[str, ...],
+    use_gzip: bool,
+) -> tuple[bytes, bytes]:
+    """Render the metrics, optionally restricted to some metric names.
+
+    The entity metrics are only rendered if entity_body is None. Returns
+    the response body and the rendered entity metrics.
+    """
+    registry: CollectorRegistry = prometheus_client.REGISTRY
+    if names:
+        registry = cast(CollectorRegistry, registry.restricted_registry(names))
+        entity_registry = cast(
+            CollectorRegistry, entity_registry.restricted_registry(names)
         )
+    if entity_body is None:
+        entity_body = encoder(entity_registry)
+    # Both parts are complete expositions, OpenMetrics ends each with EOF
+    body = encoder(registry).removesuffix(OPENMETRICS_EOF) + entity_body
+    if use_gzip:
+        body = gzip.compress(body)
+    return body, entity_body
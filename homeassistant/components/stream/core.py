@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 import datetime
 from enum import IntEnum
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -17,7 +18,9 @@ import numpy as np
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.singleton import singleton
 from homeassistant.util.decorator import Registry
+from homeassistant.util.hass_dict import HassKey
 
 from .const import (
     ATTR_STREAMS,
@@ -25,9 +28,10 @@ from .const import (
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
+from .diagnostics import Diagnostics
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -37,6 +41,22 @@ _LOGGER = logging.getLogger(__name__)
 
 PROVIDERS: Registry[str, type[StreamOutput]] = Registry()
 
+# Maximum number of keyframe images being resized and encoded at the same time
+# across all streams
+MAX_CONCURRENT_KEYFRAME_ENCODES = 2
+# Maximum number of image sizes cached for a single keyframe
+MAX_CACHED_KEYFRAME_IMAGES = 8
+DATA_KEYFRAME_ENCODE_SEMAPHORE: HassKey[asyncio.Semaphore] = HassKey(
+    "stream_keyframe_encode_semaphore"
+)
+
+
+@callback
+@singleton(DATA_KEYFRAME_ENCODE_SEMAPHORE)
+def _async_get_keyframe_encode_semaphore(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Return the semaphore bounding keyframe encodes in the executor."""
+    return asyncio.Semaphore(MAX_CONCURRENT_KEYFRAME_ENCODES)
+
 
 class Orientation(IntEnum):
     """Orientations for stream transforms. These are based on EXIF orientation tags."""
@@ -422,9 +442,13 @@ class KeyFrameConverter:
     An overview of the thread and state interaction:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
-        get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
-        _generate_image will clear the packet, so there will only be one attempt per packet
+        get_image schedules _decode_keyframe in an executor thread
+        _decode_keyframe will try to decode a frame from the packet
+        _decode_keyframe will clear the packet, so there will only be one attempt per packet
+        get_image schedules _encode_image in an executor thread for each new
+            width, height and orientation requested for the keyframe
+        the decoded frame is dropped once its image is cached, the keyframe
+            packet is decoded again when another size is requested
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
     """
@@ -434,6 +458,7 @@ class KeyFrameConverter:
         hass: HomeAssistant,
         stream_settings: StreamSettings,
         dynamic_stream_settings: DynamicStreamSettings,
+        diagnostics: Diagnostics | None = None,
     ) -> None:
         """Initialize."""
 
@@ -446,11 +471,16 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._keyframe_packet: Packet | None = None
+        self._images: dict[tuple[int | None, int | None, int], bytes] = {}
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
         self._stream_settings = stream_settings
         self._dynamic_stream_settings = dynamic_stream_settings
+        self._diagnostics = diagnostics or Diagnostics()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def stash_keyframe_packet(self, packet: Packet) -> None:
         """Store the keyframe and set the asyncio.Event from the event loop.
@@ -484,8 +514,8 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
-        """Generate the keyframe image.
+    def _decode_keyframe(self) -> VideoFrame | None:
+        """Decode the stashed keyframe.
 
         This is run in an executor thread, but since it is called within an
         the asyncio lock from the main thread, there will only be one entry
@@ -493,9 +523,21 @@ class KeyFrameConverter:
         """
 
         if not (self._turbojpeg and self._packet and self._codec_context):
-            return
+            return None
         packet = self._packet
         self._packet = None
+        if (frame := self._decode_packet(packet)) is not None:
+            self._keyframe_packet = packet
+            self._images = {}
+        return frame
+
+    def _decode_packet(self, packet: Packet) -> VideoFrame | None:
+        """Decode a keyframe packet.
+
+        This is run in an executor thread within the asyncio lock.
+        """
+        assert self._codec_context
+        start = time.monotonic()
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
@@ -511,19 +553,35 @@ class KeyFrameConverter:
                 self._codec_context.open()
         else:
             _LOGGER.debug("Unable to decode keyframe")
-            return
-        if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            return None
+        if not frames:
+            return None
+        self._diagnostics.increment("keyframe_decode")
+        self._diagnostics.set_value("keyframe_decode_time", time.monotonic() - start)
+        return frames[0]
+
+    def _encode_image(
+        self,
+        frame: VideoFrame,
+        width: int | None,
+        height: int | None,
+        orientation: int,
+    ) -> bytes:
+        """Resize, transform and encode a decoded keyframe.
+
+        This is run in an executor thread.
+        """
+        assert self._turbojpeg
+        start = time.monotonic()
+        if width and height:
+            if orientation >= 5:
+                frame = frame.reformat(width=height, height=width)
+            else:
+                frame = frame.reformat(width=width, height=height)
+        bgr_array = self.transform_image(frame.to_ndarray(format="bgr24"), orientation)
+        image = bytes(self._turbojpeg.encode(bgr_array))
+        self._diagnostics.set_value("keyframe_encode_time", time.monotonic() - start)
+        return image
 
     async def async_get_image(
         self,
@@ -538,5 +596,38 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            frame: VideoFrame | None = None
+            if self._packet is not None:
+                frame = await self._hass.async_add_executor_job(self._decode_keyframe)
+            if (packet := self._keyframe_packet) is None:
+                return self._image
+            if not (width and height):
+                width = height = None
+            key = (width, height, self._dynamic_stream_settings.orientation)
+            if (image := self._images.get(key)) is not None:
+                self._cache_hits += 1
+                self._diagnostics.increment("keyframe_image_cache_hit")
+            else:
+                self._cache_misses += 1
+                self._diagnostics.increment("keyframe_image_cache_miss")
+                # Decoded frames are not kept between requests, they are much
+                # larger than the packet and the images encoded from them
+                if frame is None and (
+                    frame := await self._hass.async_add_executor_job(
+                        self._decode_packet, packet
+                    )
+                ) is None:
+                    return self._image
+                async with _async_get_keyframe_encode_semaphore(self._hass):
+                    image = await self._hass.async_add_executor_job(
+                        self._encode_image, frame, *key
+                    )
+                if len(self._images) >= MAX_CACHED_KEYFRAME_IMAGES:
+                    del self._images[next(iter(self._images))]
+                self._images[key] = image
+            self._diagnostics.set_value(
+                "keyframe_image_cache_hit_rate",
+                self._cache_hits / (self._cache_hits + self._cache_misses),
+            )
+            self._image = image
         return self._image
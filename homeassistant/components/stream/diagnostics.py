@@ -7,6 +7,7 @@ information is managed by dependent components (e.g. camera)
 from __future__ import annotations
 
 from collections import Counter
+import threading
 from typing import Any
 
 
@@ -17,17 +18,22 @@ class Diagnostics:
         """Initialize Diagnostics."""
         self._counter: Counter = Counter()
         self._values: dict[str, Any] = {}
+        # Updated from the worker and executor threads, read from the loop
+        self._lock = threading.Lock()
 
     def increment(self, key: str) -> None:
         """Increment a counter for the specified key/event."""
-        self._counter.update(Counter({key: 1}))
+        with self._lock:
+            self._counter[key] += 1
 
     def set_value(self, key: str, value: Any) -> None:
         """Update a key/value pair."""
-        self._values[key] = value
+        with self._lock:
+            self._values[key] = value
 
     def as_dict(self) -> dict[str, Any]:
         """Return diagnostics as a debug dictionary."""
-        result = {k: self._counter[k] for k in self._counter}
-        result.update(self._values)
+        with self._lock:
+            result = {k: self._counter[k] for k in self._counter}
+            result.update(self._values)
         return result
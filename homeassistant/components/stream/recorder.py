@@ -90,7 +90,9 @@ class RecorderOutput(StreamOutput):
 
             # Open segment
             source = av.open(
-                BytesIO(segment.init + segment.get_data()),
+                BytesIO(
+                    b"".join([segment.init, *(part.data for part in segment.parts)])
+                ),
                 "r",
                 format=SEGMENT_CONTAINER_FORMAT,
             )
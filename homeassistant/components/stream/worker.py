@@ -10,6 +10,7 @@ import datetime
 from io import SEEK_END, BytesIO
 import logging
 from threading import Event
+import time
 from typing import Any, Self, cast
 
 import av
@@ -27,6 +28,7 @@ from .const import (
     PACKETS_TO_WAIT_FOR_AUDIO,
     SEGMENT_CONTAINER_FORMAT,
     SOURCE_TIMEOUT,
+    STREAM_STATS_INTERVAL,
 )
 from .core import (
     STREAM_SETTINGS_NON_LL_HLS,
@@ -430,8 +432,14 @@ class PeekIterator(Iterator):
 class TimestampValidator:
     """Validate ordering of timestamps for packets in a stream."""
 
-    def __init__(self, inv_video_time_base: int, inv_audio_time_base: int) -> None:
+    def __init__(
+        self,
+        inv_video_time_base: int,
+        inv_audio_time_base: int,
+        diagnostics: Diagnostics | None = None,
+    ) -> None:
         """Initialize the TimestampValidator."""
+        self._diagnostics = diagnostics
         # Decompression timestamp of last packet in each stream
         self._last_dts: dict[av.stream.Stream, int | float] = defaultdict(
             lambda: NEGATIVE_INF
@@ -465,11 +473,52 @@ class TimestampValidator:
                 f" {packet.dts}"
             )
         if packet.dts <= prev_dts:
+            if self._diagnostics:
+                self._diagnostics.increment("dropped_packet")
             return False
         self._last_dts[packet.stream] = packet.dts
         return True
 
 
+class WorkerStats:
+    """Track the packet rate, remux time and CPU usage of a stream worker.
+
+    Every stream worker runs in its own thread, so the CPU time of the thread
+    is the CPU cost of the stream. The values are published to the stream
+    diagnostics every STREAM_STATS_INTERVAL seconds.
+    """
+
+    def __init__(self, diagnostics: Diagnostics) -> None:
+        """Initialize WorkerStats."""
+        self._diagnostics = diagnostics
+        self._packets = 0
+        self._remux_time = 0.0
+        self._start = time.monotonic()
+        self._cpu_start = time.thread_time()
+
+    def record_packet(self, remux_time: float) -> None:
+        """Record a muxed packet and publish the stats once per interval."""
+        self._packets += 1
+        self._remux_time += remux_time
+        now = time.monotonic()
+        if (elapsed := now - self._start) <= STREAM_STATS_INTERVAL:
+            return
+        cpu_time = time.thread_time()
+        self._diagnostics.set_value("packet_rate", round(self._packets / elapsed, 1))
+        # Average time in ms spent muxing a packet
+        self._diagnostics.set_value(
+            "remux_time", round(self._remux_time / self._packets * 1000, 3)
+        )
+        self._diagnostics.set_value(
+            "worker_cpu_percent",
+            round((cpu_time - self._cpu_start) / elapsed * 100, 1),
+        )
+        self._packets = 0
+        self._remux_time = 0.0
+        self._start = now
+        self._cpu_start = cpu_time
+
+
 def is_keyframe(packet: av.Packet) -> Any:
     """Return true if the packet is a keyframe."""
     return packet.is_keyframe
@@ -550,6 +599,7 @@ def stream_worker(
     dts_validator = TimestampValidator(
         int(1 / video_stream.time_base),
         1 / audio_stream.time_base if audio_stream else 1,
+        stream_state.diagnostics,
     )
     container_packets = PeekIterator(
         filter(dts_validator.is_valid, container.demux((video_stream, audio_stream)))
@@ -608,6 +658,7 @@ def stream_worker(
 
     # Mux the first keyframe, then proceed through the rest of the packets
     muxer.mux_packet(first_keyframe)
+    stats = WorkerStats(stream_state.diagnostics)
 
     with contextlib.closing(container), contextlib.closing(muxer):
         while not quit_event.is_set():
@@ -620,7 +671,9 @@ def stream_worker(
             except av.AVError as ex:
                 raise StreamWorkerError(f"Error demuxing stream: {ex!s}") from ex
 
+            start = time.perf_counter()
             muxer.mux_packet(packet)
+            stats.record_packet(time.perf_counter() - start)
 
             if packet.is_keyframe and is_video(packet):
                 keyframe_converter.stash_keyframe_packet(packet)
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import suppress
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -57,12 +58,15 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_SIZE,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_SIZE,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    TtsAudioStreamType,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -85,6 +89,7 @@ __all__ = [
     "PLATFORM_SCHEMA",
     "SampleFormat",
     "Provider",
+    "TtsAudioStreamType",
     "TtsAudioType",
     "Voice",
 ]
@@ -127,6 +132,61 @@ class TTSCache(TypedDict):
     filename: str
     voice: bytes
     pending: asyncio.Task | None
+    stream: TTSAudioBuffer | None
+
+
+class TTSAudioBuffer:
+    """Audio chunks of a TTS voice that is still being generated."""
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._chunks: list[bytes] = []
+        self._closed = False
+        self._error: BaseException | None = None
+        self._changed = asyncio.Event()
+
+    @callback
+    def async_append(self, chunk: bytes) -> None:
+        """Add an audio chunk."""
+        self._chunks.append(chunk)
+        self._async_notify()
+
+    @callback
+    def async_close(self, error: BaseException | None = None) -> None:
+        """Mark the audio as complete or failed."""
+        self._closed = True
+        self._error = error
+        self._async_notify()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Wake up the readers."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def async_wait_for_audio(self) -> bool:
+        """Wait for the first audio chunk or the end of the audio.
+
+        Return True if there are audio chunks to stream.
+        """
+        while not self._chunks and not self._closed:
+            await self._changed.wait()
+        return bool(self._chunks)
+
+    async def async_iter_chunks(self) -> AsyncGenerator[bytes]:
+        """Yield all audio chunks, waiting for new ones until complete."""
+        position = 0
+        while True:
+            while position < len(self._chunks):
+                yield self._chunks[position]
+                position += 1
+            if self._closed:
+                if self._error is not None:
+                    raise HomeAssistantError(
+                        f"Error generating TTS audio: {self._error}"
+                    ) from self._error
+                return
+            await self._changed.wait()
 
 
 @callback
@@ -305,8 +365,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     use_cache: bool = conf.get(CONF_CACHE, DEFAULT_CACHE)
     cache_dir: str = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
     time_memory: int = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
+    # The cache is shared, so the limit applies to config entry engines too
+    cache_max_size: int = conf.get(CONF_CACHE_MAX_SIZE, DEFAULT_CACHE_MAX_SIZE)
 
-    tts = SpeechManager(hass, use_cache, cache_dir, time_memory)
+    tts = SpeechManager(
+        hass, use_cache, cache_dir, time_memory, cache_max_size * 1024 * 1024
+    )
 
     try:
         await tts.async_init_cache()
@@ -452,6 +516,24 @@ class TextToSpeechEntity(RestoreEntity):
             context=self._context,
         )
 
+    @final
+    async def internal_async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType | None:
+        """Process a streamed TTS request.
+
+        Return None if the engine does not support streaming.
+        """
+        if (
+            result := await self.async_stream_tts_audio(
+                message=message, language=language, options=options
+            )
+        ) is None:
+            return None
+        self.__last_tts_loaded = dt_util.utcnow().isoformat()
+        self.async_write_ha_state()
+        return result
+
     @final
     async def internal_async_get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
@@ -483,6 +565,18 @@ class TextToSpeechEntity(RestoreEntity):
             partial(self.get_tts_audio, message, language, options=options)
         )
 
+    async def async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType | None:
+        """Load tts audio from the engine as a stream of chunks.
+
+        Return a tuple of file extension and an async generator of audio
+        chunks, or None if streaming is not supported. Engines that can
+        return audio before the whole message is synthesized, e.g. sentence
+        by sentence, should implement this to allow playback to start early.
+        """
+        return None
+
 
 def _hash_options(options: dict) -> str:
     """Hashes an options dictionary."""
@@ -503,6 +597,7 @@ class SpeechManager:
         use_cache: bool,
         cache_dir: str,
         time_memory: int,
+        cache_max_size: int = 0,
     ) -> None:
         """Initialize a speech store."""
         self.hass = hass
@@ -511,7 +606,11 @@ class SpeechManager:
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
+        # Max bytes of the file cache, 0 means no limit
+        self.cache_max_size = cache_max_size
+        # Ordered from least to most recently used
         self.file_cache: dict[str, str] = {}
+        self.file_cache_sizes: dict[str, int] = {}
         self.mem_cache: dict[str, TTSCache] = {}
 
     def _init_cache(self) -> dict[str, str]:
@@ -528,7 +627,30 @@ class SpeechManager:
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        self.file_cache = await self.hass.async_add_executor_job(self._init_cache)
+        if self.cache_max_size:
+            # Reading the size of every cached file is slow with large caches
+            self.hass.async_create_background_task(
+                self._async_load_file_cache_usage(), "tts load file cache usage"
+            )
+
+    async def _async_load_file_cache_usage(self) -> None:
+        """Order the file cache by last use, then evict above the max size.
+
+        This method is a coroutine.
+        """
+        usage = await self.hass.async_add_executor_job(
+            _get_cache_files_usage, self.cache_dir, dict(self.file_cache)
+        )
+        file_cache: dict[str, str] = {}
+        for cache_key, size in usage:
+            if cache_key in self.file_cache:
+                file_cache[cache_key] = self.file_cache.pop(cache_key)
+                self.file_cache_sizes.setdefault(cache_key, size)
+        # Files saved or used during the scan are the most recently used
+        file_cache.update(self.file_cache)
+        self.file_cache = file_cache
+        await self._async_evict_file_cache()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
@@ -544,6 +666,42 @@ class SpeechManager:
 
         await self.hass.async_add_executor_job(remove_files)
         self.file_cache = {}
+        self.file_cache_sizes = {}
+
+    async def _async_evict_file_cache(self) -> None:
+        """Remove the least recently used files above the max cache size.
+
+        This method is a coroutine.
+        """
+        if not self.cache_max_size:
+            return
+        total = sum(self.file_cache_sizes.values())
+        filenames = []
+        for cache_key in list(self.file_cache):
+            if total <= self.cache_max_size:
+                break
+            filenames.append(self.file_cache.pop(cache_key))
+            total -= self.file_cache_sizes.pop(cache_key, 0)
+        if not filenames:
+            return
+
+        def remove_files() -> None:
+            """Remove files from filesystem."""
+            for filename in filenames:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError as err:
+                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+        _LOGGER.debug("Evicting %s files from TTS cache", len(filenames))
+        await self.hass.async_add_executor_job(remove_files)
+
+    @callback
+    def _async_touch_file_cache(self, cache_key: str) -> None:
+        """Mark a file cache entry as the most recently used."""
+        self.file_cache[cache_key] = self.file_cache.pop(cache_key)
+        if (size := self.file_cache_sizes.pop(cache_key, None)) is not None:
+            self.file_cache_sizes[cache_key] = size
 
     @callback
     def async_register_legacy_engine(
@@ -718,15 +876,42 @@ class SpeechManager:
         else:
             sample_channels = options.pop(ATTR_PREFERRED_SAMPLE_CHANNELS, None)
 
+        def needs_conversion(extension: str) -> bool:
+            """Return if the audio has to be converted.
+
+            Only convert if we have a preferred format different than the
+            expected format from the TTS system, or if a specific sample
+            rate/format/channel count is requested.
+            """
+            return (
+                (final_extension != extension)
+                or (sample_rate is not None)
+                or (sample_channels is not None)
+            )
+
         async def get_tts_data() -> str:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
 
+            streamed = False
             if isinstance(engine_instance, Provider):
                 extension, data = await engine_instance.async_get_tts_audio(
                     message, language, options
                 )
+            elif audio_stream := await engine_instance.internal_async_stream_tts_audio(
+                message, language, options
+            ):
+                extension, chunk_stream = audio_stream
+                # Pass the chunks on to clients that are already waiting
+                # when they can be played as they are
+                streamed = not needs_conversion(extension)
+                chunks = []
+                async for chunk in chunk_stream:
+                    chunks.append(chunk)
+                    if streamed:
+                        audio_buffer.async_append(chunk)
+                data = b"".join(chunks)
             else:
                 extension, data = await engine_instance.internal_async_get_tts_audio(
                     message, language, options
@@ -737,16 +922,7 @@ class SpeechManager:
                     f"No TTS from {engine_instance.name} for '{message}'"
                 )
 
-            # Only convert if we have a preferred format different than the
-            # expected format from the TTS system, or if a specific sample
-            # rate/format/channel count is requested.
-            needs_conversion = (
-                (final_extension != extension)
-                or (sample_rate is not None)
-                or (sample_channels is not None)
-            )
-
-            if needs_conversion:
+            if needs_conversion(extension):
                 data = await async_convert_audio(
                     self.hass,
                     extension,
@@ -782,12 +958,14 @@ class SpeechManager:
 
             return filename
 
+        audio_buffer = TTSAudioBuffer()
         audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
 
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
-            if audio_task.exception():
+            if error := audio_task.exception():
                 self.mem_cache.pop(cache_key, None)
+            audio_buffer.async_close(error)
 
         audio_task.add_done_callback(handle_error)
 
@@ -796,6 +974,7 @@ class SpeechManager:
             "filename": filename,
             "voice": b"",
             "pending": audio_task,
+            "stream": audio_buffer,
         }
         return filename
 
@@ -815,9 +994,13 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+        self._async_remove_from_file_cache(cache_key)
+        self.file_cache[cache_key] = filename
+        self.file_cache_sizes[cache_key] = len(data)
+        await self._async_evict_file_cache()
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
@@ -832,16 +1015,26 @@ class SpeechManager:
         def load_speech() -> bytes:
             """Load a speech from filesystem."""
             with open(voice_file, "rb") as speech:
-                return speech.read()
+                data = speech.read()
+            _touch_cache_file(voice_file)
+            return data
 
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self._async_remove_from_file_cache(cache_key)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
+        if cache_key in self.file_cache:
+            self._async_touch_file_cache(cache_key)
         self._async_store_to_memcache(cache_key, filename, data)
 
+    @callback
+    def _async_remove_from_file_cache(self, cache_key: str) -> None:
+        """Forget a file cache entry."""
+        self.file_cache.pop(cache_key, None)
+        self.file_cache_sizes.pop(cache_key, None)
+
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
@@ -851,6 +1044,7 @@ class SpeechManager:
             "filename": filename,
             "voice": data,
             "pending": None,
+            "stream": None,
         }
 
         @callback
@@ -868,20 +1062,62 @@ class SpeechManager:
             ),
         )
 
-    async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
-        """Read a voice file and return binary.
-
-        This method is a coroutine.
-        """
+    @staticmethod
+    def _get_cache_key_from_filename(filename: str) -> str:
+        """Return the cache key of a voice file."""
         if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
             record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
         ):
             raise HomeAssistantError("Wrong tts file format!")
 
-        cache_key = KEY_PATTERN.format(
+        return KEY_PATTERN.format(
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
+    async def async_get_cached_file(self, filename: str) -> str | None:
+        """Return the path of a voice file that can be served from disk.
+
+        Returns None if the voice is not in the file cache or is also held in
+        memory, in which case async_read_tts should be used.
+
+        This method is a coroutine.
+        """
+        cache_key = self._get_cache_key_from_filename(filename)
+        if cache_key in self.mem_cache or cache_key not in self.file_cache:
+            return None
+
+        voice_file = os.path.join(self.cache_dir, self.file_cache[cache_key])
+        await self.hass.async_add_executor_job(_touch_cache_file, voice_file)
+        self._async_touch_file_cache(cache_key)
+        return voice_file
+
+    @callback
+    def async_get_tts_stream(
+        self, filename: str
+    ) -> tuple[str | None, TTSAudioBuffer] | None:
+        """Return the audio buffer of a voice that is still being generated.
+
+        Only engines that stream their audio add chunks to the buffer.
+        Returns None if the voice is not being generated.
+        """
+        cache_key = self._get_cache_key_from_filename(filename)
+        if (
+            not (cached := self.mem_cache.get(cache_key))
+            or not cached["pending"]
+            or not (audio_buffer := cached["stream"])
+        ):
+            return None
+
+        content, _ = mimetypes.guess_type(filename)
+        return content, audio_buffer
+
+    async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
+        """Read a voice file and return binary.
+
+        This method is a coroutine.
+        """
+        cache_key = self._get_cache_key_from_filename(filename)
+
         if cache_key not in self.mem_cache:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
@@ -958,6 +1194,12 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _touch_cache_file(voice_file: str) -> None:
+    """Update the modification time to keep the LRU order across restarts."""
+    with suppress(OSError):
+        os.utime(voice_file)
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -974,6 +1216,22 @@ def _get_cache_files(cache_dir: str) -> dict[str, str]:
     return cache
 
 
+def _get_cache_files_usage(
+    cache_dir: str, file_cache: dict[str, str]
+) -> list[tuple[str, int]]:
+    """Return the cache keys with their file size, least recently used first."""
+    usage = []
+    for cache_key, filename in file_cache.items():
+        try:
+            stat = os.stat(os.path.join(cache_dir, filename))
+        except OSError:
+            continue
+        usage.append((stat.st_mtime, cache_key, stat.st_size))
+
+    usage.sort()
+    return [(cache_key, size) for _, cache_key, size in usage]
+
+
 class TextToSpeechUrlView(HomeAssistantView):
     """TTS view to get a url to a generated speech file."""
 
@@ -1031,9 +1289,19 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            # Stream voice files that are only on disk instead of reading
+            # them into memory
+            if voice_file := await self.tts.async_get_cached_file(filename):
+                return web.FileResponse(voice_file)
+            # Only engines that stream their audio fill the buffer, wait
+            # for the first chunk so errors can still be reported
+            if (
+                audio_stream := self.tts.async_get_tts_stream(filename)
+            ) and await audio_stream[1].async_wait_for_audio():
+                return await self._async_stream_audio(request, *audio_stream)
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
@@ -1041,6 +1309,27 @@ class TextToSpeechView(HomeAssistantView):
 
         return web.Response(body=data, content_type=content)
 
+    async def _async_stream_audio(
+        self, request: web.Request, content: str | None, audio_buffer: TTSAudioBuffer
+    ) -> web.StreamResponse:
+        """Serve a voice while it is still being generated."""
+        response = web.StreamResponse()
+        response.content_type = content or "application/octet-stream"
+        await response.prepare(request)
+        try:
+            async for chunk in audio_buffer.async_iter_chunks():
+                await response.write(chunk)
+        except HomeAssistantError as err:
+            # The status is already sent, close the connection so the
+            # client does not take the truncated audio as complete
+            _LOGGER.error("Error on load tts: %s", err)
+            response.force_close()
+            if request.transport is not None:
+                request.transport.close()
+            return response
+        await response.write_eof()
+        return response
+
 
 @websocket_api.websocket_command(
     {
@@ -1,5 +1,7 @@
 """Text-to-speech constants."""
 
+from collections.abc import AsyncGenerator
+
 ATTR_CACHE = "cache"
 ATTR_LANGUAGE = "language"
 ATTR_MESSAGE = "message"
@@ -7,11 +9,13 @@ ATTR_OPTIONS = "options"
 
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_MAX_SIZE = "cache_max_size"
 CONF_FIELDS = "fields"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+DEFAULT_CACHE_MAX_SIZE = 0  # MiB, 0 means no limit
 DEFAULT_TIME_MEMORY = 300
 
 DOMAIN = "tts"
@@ -19,3 +23,4 @@ DOMAIN = "tts"
 DATA_TTS_MANAGER = "tts_manager"
 
 type TtsAudioType = tuple[str | None, bytes | None]
+type TtsAudioStreamType = tuple[str, AsyncGenerator[bytes]]
@@ -1,8 +1,10 @@
 """Support for Wyoming text-to-speech services."""
 
 from collections import defaultdict
+from collections.abc import AsyncGenerator
 import io
 import logging
+import struct
 import wave
 
 from wyoming.audio import AudioChunk, AudioStop
@@ -12,6 +14,7 @@ from wyoming.tts import Synthesize, SynthesizeVoice
 from homeassistant.components import tts
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import ATTR_SPEAKER, DOMAIN
@@ -21,6 +24,9 @@ from .models import DomainDataItem
 
 _LOGGER = logging.getLogger(__name__)
 
+# WAV chunk size used when the length of the audio is not known yet
+_WAV_UNKNOWN_SIZE = 0xFFFFFFFF
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -108,17 +114,9 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
 
     async def async_get_tts_audio(self, message, language, options):
         """Load TTS from TCP socket."""
-        voice_name: str | None = options.get(tts.ATTR_VOICE)
-        voice_speaker: str | None = options.get(ATTR_SPEAKER)
-
         try:
             async with AsyncTcpClient(self.service.host, self.service.port) as client:
-                voice: SynthesizeVoice | None = None
-                if voice_name is not None:
-                    voice = SynthesizeVoice(name=voice_name, speaker=voice_speaker)
-
-                synthesize = Synthesize(text=message, voice=voice)
-                await client.write_event(synthesize.event())
+                await client.write_event(_synthesize(message, options).event())
 
                 with io.BytesIO() as wav_io:
                     wav_writer: wave.Wave_write | None = None
@@ -150,3 +148,71 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
             return (None, None)
 
         return ("wav", data)
+
+    async def async_stream_tts_audio(self, message, language, options):
+        """Stream TTS from TCP socket while it is being synthesized."""
+        return ("wav", self._async_stream_wav(message, options))
+
+    async def _async_stream_wav(self, message, options) -> AsyncGenerator[bytes]:
+        """Yield a WAV header followed by the audio chunks from the service."""
+        try:
+            async with AsyncTcpClient(self.service.host, self.service.port) as client:
+                await client.write_event(_synthesize(message, options).event())
+
+                header_sent = False
+                while True:
+                    event = await client.read_event()
+                    if event is None:
+                        raise HomeAssistantError("Connection lost")
+
+                    if AudioStop.is_type(event.type):
+                        break
+
+                    if AudioChunk.is_type(event.type):
+                        chunk = AudioChunk.from_event(event)
+                        if not header_sent:
+                            header_sent = True
+                            yield _wav_stream_header(
+                                chunk.rate, chunk.width, chunk.channels
+                            )
+
+                        yield chunk.audio
+
+        except (OSError, WyomingError) as err:
+            raise HomeAssistantError(f"Error streaming TTS audio: {err}") from err
+
+
+def _synthesize(message: str, options: dict) -> Synthesize:
+    """Return the synthesize request for a message."""
+    voice: SynthesizeVoice | None = None
+    if (voice_name := options.get(tts.ATTR_VOICE)) is not None:
+        voice = SynthesizeVoice(name=voice_name, speaker=options.get(ATTR_SPEAKER))
+
+    return Synthesize(text=message, voice=voice)
+
+
+def _wav_stream_header(rate: int, width: int, channels: int) -> bytes:
+    """Return a PCM WAV header for audio of unknown length.
+
+    The sizes are set to the maximum like ffmpeg does for WAV written to a
+    pipe, which players read until the end of the data.
+    """
+    return b"".join(
+        (
+            b"RIFF",
+            struct.pack("<I", _WAV_UNKNOWN_SIZE),
+            b"WAVEfmt ",
+            struct.pack(
+                "<IHHIIHH",
+                16,
+                1,
+                channels,
+                rate,
+                rate * width * channels,
+                width * channels,
+                width * 8,
+            ),
+            b"data",
+            struct.pack("<I", _WAV_UNKNOWN_SIZE),
+        )
+    )
@@ -507,22 +507,26 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
     def __init__(self) -> None:
         """Initialize the container.
 
-        Maintains three additional indexes:
+        Maintains four additional indexes:
 
         - area_id -> dict[key, True]
         - config_entry_id -> dict[key, True]
         - label -> dict[key, True]
+        - name -> dict[key, True]
         """
         super().__init__()
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._name_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: DeviceEntry) -> None:
         """Index an entry."""
         super()._index_entry(key, entry)
         if (area_id := entry.area_id) is not None:
             self._area_id_index[area_id][key] = True
+        if name := entry.name_by_user or entry.name:
+            self._name_index[name][key] = True
         for label in entry.labels:
             self._labels_index[label][key] = True
         for config_entry_id in entry.config_entries:
@@ -535,6 +539,8 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         entry = self.data[key]
         if area_id := entry.area_id:
             self._unindex_entry_value(key, area_id, self._area_id_index)
+        if name := entry.name_by_user or entry.name:
+            self._unindex_entry_value(key, name, self._name_index)
         if labels := entry.labels:
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
@@ -552,6 +558,11 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
+    def get_devices_for_name(self, name: str) -> list[DeviceEntry]:
+        """Get devices for the name set by the user or the integration."""
+        data = self.data
+        return [data[key] for key in self._name_index.get(name, ())]
+
     def get_devices_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[DeviceEntry]:
@@ -1131,6 +1142,12 @@ def async_entries_for_label(
     return registry.devices.get_devices_for_label(label_id)
 
 
+@callback
+def async_entries_for_name(registry: DeviceRegistry, name: str) -> list[DeviceEntry]:
+    """Return entries that match a name set by the user or the integration."""
+    return registry.devices.get_devices_for_name(name)
+
+
 @callback
 def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
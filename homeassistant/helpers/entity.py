@@ -280,6 +280,8 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+    - The _attr_-property setter of properties in STATIC_STATE_ATTRIBUTES_PROPERTIES
+      will also invalidate the cached static state attributes of an entity
     """
 
     def __new__(
@@ -312,6 +314,7 @@ class CachedProperties(type):
         def deleter(name: str) -> Callable[[Any], None]:
             """Create a deleter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
+            invalidate_static_attributes = name in STATIC_STATE_ATTRIBUTES_PROPERTIES
 
             def _deleter(o: Any) -> None:
                 """Delete an _attr_ property.
@@ -324,6 +327,8 @@ class CachedProperties(type):
                 """
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                if invalidate_static_attributes:
+                    o.__dict__.pop(_STATIC_STATE_ATTRIBUTES_CACHE, None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
 
@@ -332,6 +337,7 @@ class CachedProperties(type):
         def setter(name: str) -> Callable[[Any, Any], None]:
             """Create a setter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
+            invalidate_static_attributes = name in STATIC_STATE_ATTRIBUTES_PROPERTIES
 
             def _setter(o: Any, val: Any) -> None:
                 """Set an _attr_ property to the backing __attr attribute.
@@ -344,6 +350,8 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                if invalidate_static_attributes:
+                    o.__dict__.pop(_STATIC_STATE_ATTRIBUTES_CACHE, None)
 
             return _setter
 
@@ -398,6 +406,23 @@ class CachedProperties(type):
                 seen_props.add(property_name)
 
 
+# Properties which are used to build the static part of the state attributes,
+# the part which does not depend on the state of the entity
+STATIC_STATE_ATTRIBUTES_PROPERTIES = {
+    "assumed_state",
+    "attribution",
+    "device_class",
+    "entity_picture",
+    "has_entity_name",
+    "icon",
+    "name",
+    "supported_features",
+    "use_device_name",
+}
+# Instance attribute holding the cached static state attributes
+_STATIC_STATE_ATTRIBUTES_CACHE = "_Entity__static_state_attributes"
+
+
 class ABCCachedProperties(CachedProperties, ABCMeta):
     """Add ABCMeta to CachedProperties."""
 
@@ -523,6 +548,22 @@ class Entity(
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
 
+    # If all STATIC_STATE_ATTRIBUTES_PROPERTIES are cached properties, in which
+    # case the static part of the state attributes can be cached as well,
+    # set automatically by __init_subclass__
+    __static_state_attributes_cacheable: bool = True
+    # The registry entry, the device entry, the static state attributes and
+    # the static shadowed attributes the last time the state was calculated
+    __static_state_attributes: (
+        tuple[
+            er.RegistryEntry | None,
+            dr.DeviceEntry | None,
+            dict[str, Any],
+            dict[str, Any],
+        ]
+        | None
+    ) = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -553,6 +594,10 @@ class Entity(
         cls.__combined_unrecorded_attributes = (
             cls._entity_component_unrecorded_attributes | cls._unrecorded_attributes
         )
+        cls.__static_state_attributes_cacheable = all(
+            isinstance(type.__getattribute__(cls, property_name), cached_property)
+            for property_name in STATIC_STATE_ATTRIBUTES_PROPERTIES
+        )
 
     def get_hassjob_type(self, function_name: str) -> HassJobType:
         """Get the job type function for the given name.
@@ -1062,7 +1107,6 @@ class Entity(
 
         capability_attr = self.capability_attributes
         attr = capability_attr.copy() if capability_attr else {}
-        shadowed_attr = {}
 
         available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
@@ -1075,6 +1119,52 @@ class Entity(
         if (unit_of_measurement := self.unit_of_measurement) is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
+        if not self.__static_state_attributes_cacheable:
+            static_attr, shadowed_attr = self.__async_calculate_static_attributes()
+        elif (
+            (cached := self.__static_state_attributes) is not None
+            and cached[0] is entry
+            and cached[1] is self.device_entry
+        ):
+            static_attr, shadowed_attr = cached[2], cached[3]
+        else:
+            static_attr, shadowed_attr = self.__async_calculate_static_attributes()
+            self.__static_state_attributes = (
+                entry,
+                self.device_entry,
+                static_attr,
+                shadowed_attr,
+            )
+
+        attr.update(static_attr)
+        return (state, attr, capability_attr, shadowed_attr)
+
+    @callback
+    def _async_invalidate_static_state_attributes(self) -> None:
+        """Invalidate the cached static part of the state attributes.
+
+        Must be called when the cache of a property in
+        STATIC_STATE_ATTRIBUTES_PROPERTIES is cleared without using its
+        _attr_ setter.
+        """
+        self.__static_state_attributes = None
+
+    def __async_calculate_static_attributes(
+        self,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Calculate the static part of the attribute mapping.
+
+        Returns a tuple (static_attr, shadowed_attr).
+        static_attr - the attributes which do not depend on the state
+        shadowed_attr - a mapping with attributes which may be overridden
+
+        The static attributes only change when the entity registry entry, the
+        device entry or one of the STATIC_STATE_ATTRIBUTES_PROPERTIES change.
+        """
+        entry = self.registry_entry
+        attr: dict[str, Any] = {}
+        shadowed_attr: dict[str, Any] = {}
+
         if assumed_state := self.assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
@@ -1104,7 +1194,7 @@ class Entity(
         if (supported_features := self.supported_features) is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr, capability_attr, shadowed_attr)
+        return (attr, shadowed_attr)
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Mapping
 from contextvars import ContextVar
 from datetime import timedelta
 from functools import partial
@@ -49,6 +49,7 @@ from . import (
     service,
     translation,
 )
+from .device_registry import DeviceEntry, DeviceInfo, DeviceRegistry
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
@@ -628,11 +629,21 @@ class EntityPlatform:
 
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
+        device_registry = dev_reg.async_get(hass)
+        # Entities of the same device usually share the same device info,
+        # resolve it against the device registry once per batch
+        device_cache: dict[frozenset[tuple[str, Any]], str] = {}
         coros: list[Coroutine[Any, Any, None]] = []
         entities: list[Entity] = []
         for entity in new_entities:
             coros.append(
-                self._async_add_entity(entity, update_before_add, entity_registry)
+                self._async_add_entity(
+                    entity,
+                    update_before_add,
+                    entity_registry,
+                    device_registry,
+                    device_cache,
+                )
             )
             entities.append(entity)
 
@@ -646,7 +657,15 @@ class EntityPlatform:
         else:
             add_func = self._async_add_entities
 
+        start = hass.loop.time()
         await add_func(coros, entities, timeout)
+        self.logger.debug(
+            "Adding %d entities for domain %s with platform %s took %.3fs",
+            len(entities),
+            self.domain,
+            self.platform_name,
+            hass.loop.time() - start,
+        )
 
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
@@ -711,6 +730,8 @@ class EntityPlatform:
         entity: Entity,
         update_before_add: bool,
         entity_registry: EntityRegistry,
+        device_registry: DeviceRegistry,
+        device_cache: dict[frozenset[tuple[str, Any]], str],
     ) -> None:
         """Add an entity to the platform."""
         if entity is None:
@@ -769,9 +790,8 @@ class EntityPlatform:
 
             if self.config_entry and (device_info := entity.device_info):
                 try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        **device_info,
+                    device = self._async_get_or_create_device(
+                        device_registry, device_cache, device_info
                     )
                 except dev_reg.DeviceInfoError as exc:
                     self.logger.error(
@@ -913,6 +933,49 @@ class EntityPlatform:
 
         await entity.add_to_platform_finish()
 
+    @callback
+    def _async_get_or_create_device(
+        self,
+        device_registry: DeviceRegistry,
+        device_cache: dict[frozenset[tuple[str, Any]], str],
+        device_info: DeviceInfo,
+    ) -> DeviceEntry:
+        """Get or create a device, reusing the result for identical device info."""
+        assert self.config_entry
+        try:
+            key = frozenset(
+                (
+                    name,
+                    frozenset(value.items())
+                    if isinstance(value, Mapping)
+                    else frozenset(value)
+                    if isinstance(value, set)
+                    else value,
+                )
+                for name, value in device_info.items()
+            )
+            hash(key)
+        except TypeError:
+            key = None
+
+        # The device may have been changed or removed while an entity
+        # was added, so always return the current registry entry
+        if (
+            key is not None
+            and (device_id := device_cache.get(key))
+            and (device := device_registry.async_get(device_id))
+            and self.config_entry.entry_id in device.config_entries
+        ):
+            return device
+
+        device = device_registry.async_get_or_create(
+            config_entry_id=self.config_entry.entry_id,
+            **device_info,
+        )
+        if key is not None:
+            device_cache[key] = device.id
+        return device
+
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
 
@@ -17,10 +17,13 @@ from homeassistant.components.conversation.trace import (
     async_conversation_trace_append,
 )
 from homeassistant.components.cover.intent import INTENT_CLOSE_COVER, INTENT_OPEN_COVER
-from homeassistant.components.homeassistant.exposed_entities import async_should_expose
+from homeassistant.components.homeassistant.exposed_entities import (
+    ExposedEntityInfo,
+    async_get_exposed_entities_snapshot,
+)
 from homeassistant.components.intent import async_device_supports_timers
 from homeassistant.components.weather.intent import INTENT_GET_WEATHER
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import yaml
 from homeassistant.util.json import JsonObjectType
@@ -268,28 +271,39 @@ class AssistAPI(API):
             partial(unicode_slug.slugify, separator="_", lowercase=False)
         )
 
+        self._exposed_entities: dict[str, ExposedEntitiesPrompt] = {}
+
     async def async_get_api_instance(self, llm_context: LLMContext) -> APIInstance:
         """Return the instance of the API."""
+        exposed_entities: ExposedEntitiesPrompt | None = None
         if llm_context.assistant:
-            exposed_entities: dict | None = _get_exposed_entities(
-                self.hass, llm_context.assistant
-            )
-        else:
-            exposed_entities = None
+            exposed_entities = self._async_get_exposed_entities(llm_context.assistant)
 
         return APIInstance(
             api=self,
             api_prompt=self._async_get_api_prompt(llm_context, exposed_entities),
             llm_context=llm_context,
-            tools=self._async_get_tools(llm_context, exposed_entities),
+            tools=self._async_get_tools(
+                llm_context, exposed_entities.entities if exposed_entities else None
+            ),
         )
 
+    @callback
+    def _async_get_exposed_entities(self, assistant: str) -> ExposedEntitiesPrompt:
+        """Return the entities exposed to an assistant with their current state."""
+        if (exposed_entities := self._exposed_entities.get(assistant)) is None:
+            exposed_entities = ExposedEntitiesPrompt(self.hass, assistant)
+            self._exposed_entities[assistant] = exposed_entities
+
+        exposed_entities.async_update()
+        return exposed_entities
+
     @callback
     def _async_get_api_prompt(
-        self, llm_context: LLMContext, exposed_entities: dict | None
+        self, llm_context: LLMContext, exposed_entities: ExposedEntitiesPrompt | None
     ) -> str:
         """Return the prompt for the API."""
-        if not exposed_entities:
+        if not exposed_entities or not exposed_entities.entities:
             return (
                 "Only if the user wants to control a device, tell them to expose entities "
                 "to their voice assistant in Home Assistant."
@@ -334,11 +348,8 @@ class AssistAPI(API):
         ):
             prompt.append("This device does not support timers.")
 
-        if exposed_entities:
-            prompt.append(
-                "An overview of the areas and the devices in this smart home:"
-            )
-            prompt.append(yaml.dump(exposed_entities))
+        prompt.append("An overview of the areas and the devices in this smart home:")
+        prompt.append(exposed_entities.yaml)
 
         return "\n".join(prompt)
 
@@ -385,87 +396,170 @@ class AssistAPI(API):
         ]
 
 
-def _get_exposed_entities(
-    hass: HomeAssistant, assistant: str
-) -> dict[str, dict[str, Any]]:
-    """Get exposed entities."""
-    area_registry = ar.async_get(hass)
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
-    interesting_attributes = {
-        "temperature",
-        "current_temperature",
-        "temperature_unit",
-        "brightness",
-        "humidity",
-        "unit_of_measurement",
-        "device_class",
-        "current_position",
-        "percentage",
-        "volume_level",
-        "media_title",
-        "media_artist",
-        "media_album_name",
-    }
+_EXPOSED_ATTRIBUTES = {
+    "temperature",
+    "current_temperature",
+    "temperature_unit",
+    "brightness",
+    "humidity",
+    "unit_of_measurement",
+    "device_class",
+    "current_position",
+    "percentage",
+    "volume_level",
+    "media_title",
+    "media_artist",
+    "media_album_name",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _ExposedEntityStaticInfo:
+    """Part of the info of an exposed entity that doesn't follow its state."""
+
+    names: str
+    areas: str | None
+    script_id: str | None
+
+
+class ExposedEntitiesPrompt:
+    """Entities exposed to an assistant and their YAML for the LLM prompt.
+
+    Names and areas are cached until the exposed entities snapshot changes.
+    The YAML of an entity is only rendered again when its state changed, so
+    the overview is reused across turns and conversations.
+    """
+
+    def __init__(self, hass: HomeAssistant, assistant: str) -> None:
+        """Initialize the exposed entities prompt."""
+        self._hass = hass
+        self._assistant = assistant
+        self._version: int | None = None
+        self._static_info: dict[str, _ExposedEntityStaticInfo] = {}
+        # entity_id -> (state, static info, description, info, yaml)
+        self._rendered: dict[
+            str,
+            tuple[State, _ExposedEntityStaticInfo, str | None, dict[str, Any], str],
+        ] = {}
+        self.entities: dict[str, dict[str, Any]] = {}
+        self.yaml = ""
+
+    @callback
+    def async_update(self) -> None:
+        """Update the exposed entities with their current state."""
+        snapshot = async_get_exposed_entities_snapshot(self._hass, self._assistant)
+        if snapshot.version != self._version:
+            self._async_update_static_info(snapshot.entities)
+            self._version = snapshot.version
+
+        changed = False
+        rendered = {}
+        for entity_id, static_info in self._static_info.items():
+            if (state := self._hass.states.get(entity_id)) is None:
+                continue
+
+            description: str | None = None
+            if static_info.script_id and (
+                service_desc := service.async_get_cached_service_description(
+                    self._hass, "script", static_info.script_id
+                )
+            ):
+                description = service_desc.get("description")
 
-    entities = {}
+            if (
+                (cached := self._rendered.get(entity_id)) is None
+                or cached[0] is not state
+                or cached[1] is not static_info
+                or cached[2] != description
+            ):
+                info = _make_exposed_entity_info(state, static_info, description)
+                cached = (
+                    state,
+                    static_info,
+                    description,
+                    info,
+                    yaml.dump({entity_id: info}),
+                )
+                changed = True
 
-    for state in hass.states.async_all():
-        if not async_should_expose(hass, assistant, state.entity_id):
-            continue
+            rendered[entity_id] = cached
+
+        if changed or rendered.keys() != self._rendered.keys():
+            self.entities = {
+                entity_id: cached[3] for entity_id, cached in rendered.items()
+            }
+            # Dumping each entity on its own gives the same YAML as dumping all
+            self.yaml = "".join(cached[4] for cached in rendered.values())
 
-        entity_entry = entity_registry.async_get(state.entity_id)
-        names = [state.name]
-        area_names = []
-        description: str | None = None
+        self._rendered = rendered
 
-        if entity_entry is not None:
-            names.extend(entity_entry.aliases)
-            if entity_entry.area_id and (
-                area := area_registry.async_get_area(entity_entry.area_id)
+    @callback
+    def _async_update_static_info(
+        self, exposed_entities: dict[str, ExposedEntityInfo]
+    ) -> None:
+        """Update the names, areas and script ids of the exposed entities."""
+        area_registry = ar.async_get(self._hass)
+        entity_registry = er.async_get(self._hass)
+        static_info: dict[str, _ExposedEntityStaticInfo] = {}
+
+        for entity_id, exposed_info in exposed_entities.items():
+            area_names = []
+            if exposed_info.area_id and (
+                area := area_registry.async_get_area(exposed_info.area_id)
             ):
-                # Entity is in area
                 area_names.append(area.name)
                 area_names.extend(area.aliases)
-            elif entity_entry.device_id and (
-                device := device_registry.async_get(entity_entry.device_id)
-            ):
-                # Check device area
-                if device.area_id and (
-                    area := area_registry.async_get_area(device.area_id)
-                ):
-                    area_names.append(area.name)
-                    area_names.extend(area.aliases)
 
+            script_id: str | None = None
             if (
-                state.domain == "script"
+                entity_id.startswith("script.")
+                and (entity_entry := entity_registry.async_get(entity_id))
                 and entity_entry.unique_id
-                and (
-                    service_desc := service.async_get_cached_service_description(
-                        hass, "script", entity_entry.unique_id
-                    )
-                )
             ):
-                description = service_desc.get("description")
+                script_id = entity_entry.unique_id
 
-        info: dict[str, Any] = {
-            "names": ", ".join(names),
-            "state": state.state,
-        }
+            info = _ExposedEntityStaticInfo(
+                ", ".join([exposed_info.name, *exposed_info.aliases]),
+                ", ".join(area_names) if area_names else None,
+                script_id,
+            )
+            if info == self._static_info.get(entity_id):
+                # Keep the rendered YAML of unchanged entities
+                info = self._static_info[entity_id]
+            static_info[entity_id] = info
+
+        self._static_info = static_info
+
+
+def _make_exposed_entity_info(
+    state: State, static_info: _ExposedEntityStaticInfo, description: str | None
+) -> dict[str, Any]:
+    """Make the info of an exposed entity for the prompt."""
+    info: dict[str, Any] = {
+        "names": static_info.names,
+        "state": state.state,
+    }
 
-        if description:
-            info["description"] = description
+    if description:
+        info["description"] = description
 
-        if area_names:
-            info["areas"] = ", ".join(area_names)
+    if static_info.areas:
+        info["areas"] = static_info.areas
 
-        if attributes := {
-            attr_name: str(attr_value) if isinstance(attr_value, Enum) else attr_value
-            for attr_name, attr_value in state.attributes.items()
-            if attr_name in interesting_attributes
-        }:
-            info["attributes"] = attributes
+    if attributes := {
+        attr_name: str(attr_value) if isinstance(attr_value, Enum) else attr_value
+        for attr_name, attr_value in state.attributes.items()
+        if attr_name in _EXPOSED_ATTRIBUTES
+    }:
+        info["attributes"] = attributes
 
-        entities[state.entity_id] = info
+    return info
 
-    return entities
+
+def _get_exposed_entities(
+    hass: HomeAssistant, assistant: str
+) -> dict[str, dict[str, Any]]:
+    """Get exposed entities."""
+    exposed_entities = ExposedEntitiesPrompt(hass, assistant)
+    exposed_entities.async_update()
+    return exposed_entities.entities
@@ -29,6 +29,7 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.environment import TemplateExpression
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -148,6 +149,7 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+SAFE_ATTRIBUTE_CACHE_SIZE = 1024
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
@@ -487,6 +489,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_compiled_native",
         "_exc_info",
         "_limited",
         "_strict",
@@ -503,6 +506,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._compiled_native: TemplateExpression | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -600,8 +604,19 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        native = self._compiled_native
+        if not parse_result or self.hass and self.hass.config.legacy_templates:
+            native = None
+
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if native is not None:
+                result, render_result = _render_native_with_context(
+                    self.template, native, **kwargs
+                )
+                if render_result is None:
+                    return result
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -817,9 +832,42 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        self._compiled_native = self._compile_native(env)
 
         return self._compiled
 
+    def _compile_native(self, env: TemplateEnvironment) -> TemplateExpression | None:
+        """Compile a template made of a single expression to a native expression.
+
+        Rendering the expression returns the Python object instead of its
+        string representation, which avoids parsing the string back with
+        _cached_parse_result for common results like numbers and booleans.
+        """
+        template = self.template
+        if (
+            not template.startswith("{{")
+            or not template.endswith("}}")
+            or template.startswith("{{+")
+            or template.count("{{") != 1
+            or template.count("}}") != 1
+            or "{%" in template
+            or "{#" in template
+        ):
+            return None
+        source = template[2:-2]
+        if source.startswith("-"):
+            source = source[1:]
+        if source.endswith("-"):
+            source = source[:-1]
+        if expression := env.expression_cache.get(source):
+            return expression
+        try:
+            expression = env.compile_expression(source, undefined_to_none=False)
+        except jinja2.TemplateError:
+            return None
+        env.expression_cache[source] = expression
+        return expression
+
     def __eq__(self, other):
         """Compare template with another."""
         return (
@@ -1352,15 +1400,11 @@ def device_id(hass: HomeAssistant, entity_id_or_device_name: str) -> str | None:
         return entity.device_id
 
     dev_reg = device_registry.async_get(hass)
-    return next(
-        (
-            device_id
-            for device_id, device in dev_reg.devices.items()
-            if (name := device.name_by_user or device.name)
-            and (str(entity_id_or_device_name) == name)
-        ),
-        None,
-    )
+    if devices := device_registry.async_entries_for_name(
+        dev_reg, str(entity_id_or_device_name)
+    ):
+        return devices[0].id
+    return None
 
 
 def device_attr(hass: HomeAssistant, device_or_entity_id: str, attr_name: str) -> Any:
@@ -2621,6 +2665,27 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _render_native_with_context(
+    template_str: str, expression: TemplateExpression, **kwargs: Any
+) -> tuple[Any, str | None]:
+    """Render a native expression with the template stored in a ContextVar.
+
+    Returns the result if it is the same as parsing its string representation
+    would give, otherwise the string representation which needs parsing.
+    """
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        result = expression(**kwargs)
+        result_type = type(result)
+        if result is None or result_type is bool or result_type is int:
+            return result, None
+        # Convert while rendering so undefined values log or raise as usual
+        render_result = str(result)
+    if result_type is float and _IS_NUMERIC.match(render_result) is not None:
+        return result, None
+    return None, render_result
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2743,6 +2808,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.expression_cache: weakref.WeakValueDictionary[
+            str, TemplateExpression
+        ] = weakref.WeakValueDictionary()
+        self._safe_attribute_cache: LRU[tuple[type, str], bool] = LRU(
+            SAFE_ATTRIBUTE_CACHE_SIZE
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3033,7 +3104,20 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         ) or super().is_safe_callable(obj)
 
     def is_safe_attribute(self, obj, attr, value):
-        """Test if attribute is safe."""
+        """Test if attribute is safe.
+
+        The sandbox only looks at the type of the object and the name of
+        the attribute, so the decision is cached per (type, attr).
+        """
+        key = (type(obj), attr)
+        if (safe := self._safe_attribute_cache.get(key)) is None:
+            safe = self._safe_attribute_cache[key] = self._is_safe_attribute(
+                obj, attr, value
+            )
+        return safe
+
+    def _is_safe_attribute(self, obj: Any, attr: str, value: Any) -> bool:
+        """Test if attribute is safe without using the cache."""
         if isinstance(
             obj, (AllStates, DomainStates, TemplateState, LoopContext, AsyncLoopContext)
         ):
@@ -7,10 +7,10 @@ import asyncio
 from collections.abc import Awaitable, Callable, Coroutine
 from datetime import datetime, timedelta
 import logging
-from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol
 import urllib.error
+from zlib import crc32
 
 import aiohttp
 import requests
@@ -25,13 +25,27 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
+from .singleton import singleton
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+# Maximum number of scheduled refreshes of all coordinators running at
+# the same time, to avoid bursts of outgoing connections and event loop
+# latency spikes when many coordinators poll on the same interval.
+MAX_CONCURRENT_SCHEDULED_REFRESHES = 16
+# Seconds a scheduled refresh counts against the limit. Coordinators have
+# no update timeout, so refreshes that hang must not block the others.
+SCHEDULED_REFRESH_SLOT_TIMEOUT = 10
+
+DATA_SCHEDULED_REFRESH_SEMAPHORE: HassKey[asyncio.Semaphore] = HassKey(
+    "update_coordinator_scheduled_refresh_semaphore"
+)
+
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
     "_DataUpdateCoordinatorT",
@@ -44,6 +58,13 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@callback
+@singleton(DATA_SCHEDULED_REFRESH_SEMAPHORE)
+def _async_get_scheduled_refresh_semaphore(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent scheduled refreshes."""
+    return asyncio.Semaphore(MAX_CONCURRENT_SCHEDULED_REFRESHES)
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -91,11 +112,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
+        # Pick a microsecond in range 0.05..0.50 to stagger the refreshes
+        # and avoid a thundering herd. The microsecond is derived from the
+        # name and the config entry so a coordinator keeps its slot.
+        jitter_key = f"{self.config_entry.entry_id if self.config_entry else ''}{name}"
         self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
-        )
+            event.RANDOM_MICROSECOND_MIN
+            + crc32(jitter_key.encode())
+            % (event.RANDOM_MICROSECOND_MAX - event.RANDOM_MICROSECOND_MIN + 1)
+        ) / 10**6
+        # Loop time the next scheduled refresh is due
+        self._scheduled_refresh_time: float | None = None
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
@@ -103,6 +130,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
         self.last_exception: Exception | None = None
+        # Duration of the last refresh in seconds
+        self.last_update_duration: float | None = None
+        # Seconds the last scheduled refresh started after it was due
+        self.last_update_lateness: float | None = None
 
         if request_refresh_debouncer is None:
             request_refresh_debouncer = Debouncer(
@@ -228,6 +259,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         next_refresh = (
             int(loop.time()) + self._microsecond + self._update_interval_seconds
         )
+        self._scheduled_refresh_time = next_refresh
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
@@ -252,7 +284,29 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        semaphore = _async_get_scheduled_refresh_semaphore(self.hass)
+        await semaphore.acquire()
+        released = False
+
+        @callback
+        def _async_release_slot() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                semaphore.release()
+
+        release_timer = self.hass.loop.call_later(
+            SCHEDULED_REFRESH_SLOT_TIMEOUT, _async_release_slot
+        )
+        try:
+            if (scheduled_time := self._scheduled_refresh_time) is not None:
+                self.last_update_lateness = max(
+                    self.hass.loop.time() - scheduled_time, 0.0
+                )
+            await self._async_refresh(log_failures=True, scheduled=True)
+        finally:
+            release_timer.cancel()
+            _async_release_slot()
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -301,9 +355,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
-
+        start = monotonic()
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
@@ -388,11 +440,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
-            if log_timing:
+            self.last_update_duration = monotonic() - start
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,
+                    self.last_update_duration,
                     self.last_update_success,
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
@@ -9,6 +9,8 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+from pathlib import Path
+import tempfile
 from timeit import default_timer as timer
 
 from homeassistant import core
@@ -312,6 +314,389 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def write_ha_state(hass):
+    """Write the state of an entity a million times, changing every 10th write."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity import Entity
+
+    entity = Entity()
+    entity.hass = hass
+    entity.entity_id = "sensor.outside_temperature"
+    entity._attr_name = "Outside temperature"  # noqa: SLF001
+    entity._attr_unit_of_measurement = "°C"  # noqa: SLF001
+    entity._attr_device_class = "temperature"  # noqa: SLF001
+    entity._attr_icon = "mdi:thermometer"  # noqa: SLF001
+
+    start = timer()
+    for count in range(10**6):
+        if count % 10 == 0:
+            entity._attr_state = count  # noqa: SLF001
+        entity.async_write_ha_state()
+    return timer() - start
+
+
+@benchmark
+async def validate_access_token(hass):
+    """Validate access tokens of 4 clients a hundred thousand times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth import auth_manager_from_config
+
+    manager = await auth_manager_from_config(hass, [], [])
+    user = await manager.async_create_user("Benchmark")
+    access_tokens = [
+        manager.async_create_access_token(
+            await manager.async_create_refresh_token(user, f"https://client{idx}/")
+        )
+        for idx in range(4)
+    ]
+
+    start = timer()
+    for count in range(10**5):
+        manager.async_validate_access_token(access_tokens[count % 4])
+    return timer() - start
+
+
+@benchmark
+async def static_not_modified(hass):
+    """Revalidate a cached static file ten thousand times."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp import web
+
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp.test_utils import make_mocked_request
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.http.const import KEY_HASS
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.http.static import CachingStaticResource
+
+    app = web.Application()
+    app[KEY_HASS] = hass
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, "card.js")
+        path.write_text("console.log('card');")
+        st = path.stat()
+        headers = {"If-None-Match": f'"{st.st_mtime_ns:x}-{st.st_size:x}"'}
+        resource = CachingStaticResource("/cards", directory)
+
+        start = timer()
+        for _ in range(10**4):
+            request = make_mocked_request(
+                "GET",
+                "/cards/card.js",
+                headers=headers,
+                match_info={"filename": "card.js"},
+                app=app,
+            )
+            # pylint: disable-next=protected-access
+            response = await resource._handle(request)
+            await response.prepare(request)
+        return timer() - start
+
+
+@benchmark
+async def bluetooth_match_advertisements(hass):
+    """Match a million advertisements against the bluetooth matchers."""
+    # pylint: disable-next=import-outside-toplevel
+    from bleak.backends.device import BLEDevice
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.bluetooth.match import (
+        BluetoothCallbackMatcherIndex,
+        BluetoothCallbackMatcherWithCallback,
+        IntegrationMatcher,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.bluetooth.models import BluetoothServiceInfoBleak
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.bluetooth import BLUETOOTH
+
+    integration_matcher = IntegrationMatcher(BLUETOOTH)
+    integration_matcher.async_setup()
+    callback_index = BluetoothCallbackMatcherIndex()
+    for matcher in BLUETOOTH:
+        callback_index.add_callback_matcher(
+            BluetoothCallbackMatcherWithCallback(callback=lambda *_: None, **matcher)
+        )
+
+    advertisements = [
+        # Apple nearby info, the most common advertisement
+        ("01", None, {76: b"\x10\x05\x01\x18"}, {}, []),
+        # Apple iBeacon
+        ("02", None, {76: b"\x02\x15\x00"}, {}, []),
+        # Unknown manufacturer
+        ("03", None, {1234: b"\x01"}, {}, []),
+        # Unknown named device
+        ("04", "Unknown", {}, {}, []),
+        # Service data
+        (
+            "05",
+            None,
+            {},
+            {"0000fcd2-0000-1000-8000-00805f9b34fb": b"\x40"},
+            [],
+        ),
+    ]
+    service_infos = []
+    for idx in range(200):
+        for (
+            suffix,
+            name,
+            manufacturer_data,
+            service_data,
+            service_uuids,
+        ) in advertisements:
+            address = f"AA:BB:CC:DD:{idx:02X}:{suffix}"
+            service_infos.append(
+                BluetoothServiceInfoBleak(
+                    name=name or address,
+                    address=address,
+                    rssi=-60,
+                    manufacturer_data=manufacturer_data,
+                    service_data=service_data,
+                    service_uuids=service_uuids,
+                    source="local",
+                    device=BLEDevice(address, name, None, -60),
+                    advertisement=None,
+                    connectable=True,
+                    time=0,
+                    tx_power=None,
+                )
+            )
+
+    start = timer()
+    for _ in range(10**6 // len(service_infos)):
+        for service_info in service_infos:
+            integration_matcher.match_domains(service_info)
+            callback_index.match_callbacks(service_info)
+    return timer() - start
+
+
+@benchmark
+async def assist_pipeline_vad(hass):
+    """Run 10 satellite streams of 1 minute audio each through voice detection.
+
+    Dividing the 600 seconds of audio by the result gives the number of
+    satellites a single core can keep up with.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.vad import (
+        AudioBuffer,
+        VoiceCommandSegmenter,
+        WebRtcVad,
+    )
+
+    # 32 ms packets of 16 kHz 16-bit audio, alternating speech and silence
+    loud = bytes(range(256)) * 4
+    silence = bytes(1024)
+    packets = ([loud] * 30 + [silence] * 30) * 31
+
+    satellites = []
+    for _ in range(10):
+        vad = WebRtcVad()
+        satellites.append(
+            (
+                vad,
+                VoiceCommandSegmenter(timeout_seconds=3600),
+                AudioBuffer(vad.samples_per_chunk * 2),
+            )
+        )
+
+    start = timer()
+    for packet in packets:
+        for vad, segmenter, vad_buffer in satellites:
+            segmenter.process_with_vad(packet, vad, vad_buffer)
+    return timer() - start
+
+
+@benchmark
+async def conversation_slot_lists(hass):
+    """Prepare the Assist slot lists for 1000 utterances with 4000 entities.
+
+    One entity is renamed before every utterance, which changes the exposed
+    entities snapshot that the slot lists are built from.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation.default_agent import DefaultAgent
+
+    await _async_setup_exposed_lights(hass, 4000)
+    agent = DefaultAgent(hass, {})
+
+    start = timer()
+    for idx in range(1000):
+        hass.states.async_set(
+            f"light.light_{idx}", "on", {"friendly_name": f"Lamp {idx}"}
+        )
+        # pylint: disable-next=protected-access
+        agent._make_slot_lists()
+    return timer() - start
+
+
+@benchmark
+async def llm_exposed_entities_prompt(hass):
+    """Assemble the exposed entities prompt for 1000 turns with 800 entities.
+
+    One entity changes state before every turn.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.llm import ExposedEntitiesPrompt
+
+    await _async_setup_exposed_lights(hass, 800)
+    exposed_entities = ExposedEntitiesPrompt(hass, "conversation")
+
+    start = timer()
+    for idx in range(1000):
+        hass.states.async_set(
+            f"light.light_{idx % 800}",
+            "off" if idx < 800 else "on",
+            {"friendly_name": f"Light {idx % 800}", "brightness": idx % 256},
+        )
+        exposed_entities.async_update()
+    return timer() - start
+
+
+@benchmark
+async def template_registry_lookups(hass):
+    """Look up devices and entities in templates with 100 areas and 2000 devices.
+
+    Each round finds a device by name and the devices and entities of an area.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+        template,
+    )
+
+    for registry in (ar, dr, er, fr, lr):
+        await registry.async_load(hass)
+    area_reg = ar.async_get(hass)
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    area_ids = [area_reg.async_create(f"Area {idx}").id for idx in range(100)]
+    for idx in range(2000):
+        device = dr.DeviceEntry(area_id=area_ids[idx % 100], name=f"Device {idx}")
+        dev_reg.devices[device.id] = device
+        entry = er.RegistryEntry(
+            entity_id=f"light.light_{idx}",
+            unique_id=str(idx),
+            platform="benchmark",
+            device_id=device.id,
+        )
+        ent_reg.entities[entry.entity_id] = entry
+
+    start = timer()
+    for idx in range(10**4):
+        template.device_id(hass, f"Device {idx % 2000}")
+        template.area_devices(hass, area_ids[idx % 100])
+        template.area_entities(hass, area_ids[idx % 100])
+    return timer() - start
+
+
+@benchmark
+async def template_render(hass):
+    """Render dashboard and automation templates with 500 entities.
+
+    Each round renders every template once while collecting render info.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    for idx in range(250):
+        hass.states.async_set(
+            f"light.light_{idx}",
+            "on" if idx % 3 else "off",
+            {"friendly_name": f"Light {idx}", "brightness": idx % 256},
+        )
+        hass.states.async_set(
+            f"sensor.temperature_{idx}",
+            str(18 + idx % 10),
+            {"unit_of_measurement": "°C", "device_class": "temperature"},
+        )
+    templates = [
+        Template(source, hass)
+        for source in (
+            "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+            "{{ states('sensor.temperature_1') | float(0) + 1 }}",
+            "{{ is_state('light.light_1', 'on')"
+            " and state_attr('light.light_1', 'brightness') > 100 }}",
+            "{% for idx in range(20) %}"
+            "{{ states.sensor['temperature_' ~ idx].state }}"
+            "{{ states.sensor['temperature_' ~ idx].attributes.unit_of_measurement }}"
+            "{% endfor %}",
+            "{{ expand(states.light | map(attribute='entity_id') | list)"
+            " | map(attribute='name') | join(', ') }}",
+        )
+    ]
+
+    start = timer()
+    for _ in range(10**3):
+        for tmpl in templates:
+            tmpl.async_render_to_info()
+    return timer() - start
+
+
+@benchmark
+async def template_sensor_render(hass):
+    """Render 1500 numeric template sensor templates.
+
+    Each round renders every template once while collecting render info.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    templates = []
+    for idx in range(1500):
+        hass.states.async_set(f"sensor.power_{idx}", str(idx % 100 * 1.5))
+        templates.append(
+            Template(f"{{{{ states('sensor.power_{idx}') | float(0) * 230 }}}}", hass)
+        )
+
+    start = timer()
+    for _ in range(10):
+        for tmpl in templates:
+            tmpl.async_render_to_info()
+    return timer() - start
+
+
+async def _async_setup_exposed_lights(hass, count):
+    """Set up the registries and expose settings with exposed lights."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.homeassistant.const import DATA_EXPOSED_ENTITIES
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.homeassistant.exposed_entities import (
+        ExposedEntities,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+    )
+
+    for registry in (ar, dr, er, fr):
+        await registry.async_load(hass)
+    exposed_entities = ExposedEntities(hass)
+    await exposed_entities.async_initialize()
+    hass.data[DATA_EXPOSED_ENTITIES] = exposed_entities
+
+    for idx in range(count):
+        hass.states.async_set(
+            f"light.light_{idx}", "on", {"friendly_name": f"Light {idx}"}
+        )
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
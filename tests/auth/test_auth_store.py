@@ -8,7 +8,15 @@ from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.auth import auth_store
+from homeassistant.auth.permissions import PolicyPermissions
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from tests.common import MockConfigEntry
 
 MOCK_STORAGE_DATA = {
     "version": 1,
@@ -321,6 +329,44 @@ async def test_add_remove_user_affects_tokens(
     assert user.refresh_tokens == {}
 
 
+async def test_permissions_follow_registry_changes(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test cached area permissions are refreshed when the registries change."""
+    store = auth_store.AuthStore(hass)
+    await store.async_load()
+    user = await store.async_create_user("Test User")
+
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    area = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("test", "1")}
+    )
+    entry = entity_registry.async_get_or_create(
+        "light", "test", "1", device_id=device.id
+    )
+    await hass.async_block_till_done()
+
+    permissions = PolicyPermissions(
+        {"entities": {"area_ids": {area.id: {"read": True}}}}, user.perm_lookup
+    )
+    assert permissions.check_entity(entry.entity_id, "read") is False
+
+    device_registry.async_update_device(device.id, area_id=area.id)
+    await hass.async_block_till_done()
+    assert permissions.check_entity(entry.entity_id, "read") is True
+    assert permissions.check_entity(entry.entity_id, "control") is False
+
+    entity_registry.async_update_entity(entry.entity_id, device_id=None)
+    await hass.async_block_till_done()
+    assert permissions.check_entity(entry.entity_id, "read") is False
+
+
 async def test_set_expiry_date(
     hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
 ) -> None:
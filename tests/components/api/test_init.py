@@ -44,6 +44,42 @@ async def test_api_list_state_entities(
     assert remote_data == local_data
 
 
+async def test_api_list_states_etag_and_filters(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test listing states supports ETags and domain and since filters."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.pump", "off")
+    await hass.async_block_till_done()
+
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    hass.states.async_set("switch.pump", "on")
+    await hass.async_block_till_done()
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"domain": "LIGHT"})
+    assert [state["entity_id"] for state in await resp.json()] == ["light.kitchen"]
+
+    since = hass.states.get("switch.pump").last_updated.isoformat()
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": since})
+    assert [state["entity_id"] for state in await resp.json()] == ["switch.pump"]
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "nope"})
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_api_get_state(hass: HomeAssistant, mock_api_client: TestClient) -> None:
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
@@ -37,3 +37,15 @@ def test_ring_buffer_put_too_large() -> None:
     assert len(rb) == 10
     assert rb.pos == 2
     assert rb.getvalue() == bytes([3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+
+
+def test_ring_buffer_put_wrap_before_full() -> None:
+    """Test getting data that has not filled the buffer past half of it."""
+    rb = RingBuffer(10)
+    rb.put(bytes([1, 2, 3, 4, 5, 6]))
+    assert len(rb) == 6
+    assert rb.getvalue() == bytes([1, 2, 3, 4, 5, 6])
+    rb.put(bytes([7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23]))
+    assert len(rb) == 10
+    assert rb.pos == 3
+    assert rb.getvalue() == bytes([14, 15, 16, 17, 18, 19, 20, 21, 22, 23])
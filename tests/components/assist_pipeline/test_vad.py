@@ -7,6 +7,7 @@ from homeassistant.components.assist_pipeline.vad import (
     AudioBuffer,
     VoiceActivityDetector,
     VoiceCommandSegmenter,
+    WebRtcVad,
     chunk_samples,
 )
 
@@ -165,3 +166,48 @@ def test_vad_no_chunking() -> None:
     # end
     assert segmenter.process_with_vad(silence, vad, None)
     assert not segmenter.process_with_vad(silence, vad, None)
+
+
+def test_webrtc_vad_skips_silence() -> None:
+    """Test that silent chunks are not passed to the webrtc VAD."""
+    with patch("webrtc_noise_gain.AudioProcessor") as mock_audio_processor:
+        vad = WebRtcVad()
+
+    mock_process = mock_audio_processor.return_value.Process10ms
+    mock_process.return_value.is_speech = True
+    silence = bytes(vad.samples_per_chunk * 2)
+    speech = bytes([255] * vad.samples_per_chunk * 2)
+
+    assert list(vad.is_speech_chunks([])) == []
+    assert list(vad.is_speech_chunks([silence, speech, silence])) == [
+        False,
+        True,
+        False,
+    ]
+    mock_process.assert_called_once_with(speech)
+
+
+def test_vad_stops_at_end_of_command() -> None:
+    """Test no more chunks are checked once the voice command has finished."""
+
+    class SpeechVad(VoiceActivityDetector):
+        def is_speech(self, chunk):
+            return True
+
+        @property
+        def samples_per_chunk(self):
+            return 160  # 10 ms
+
+    vad = SpeechVad()
+    bytes_per_chunk = vad.samples_per_chunk * 2
+    vad_buffer = AudioBuffer(bytes_per_chunk)
+    segmenter = VoiceCommandSegmenter()
+    ten_chunks = bytes(bytes_per_chunk * 10)
+
+    with (
+        patch.object(vad, "is_speech", return_value=True) as mock_process,
+        patch.object(segmenter, "process", side_effect=[True, True, False]),
+    ):
+        assert not segmenter.process_with_vad(ten_chunks, vad, vad_buffer)
+
+    assert mock_process.call_count == 3
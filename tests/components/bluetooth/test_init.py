@@ -1,6 +1,7 @@
 """Tests for the Bluetooth integration."""
 
 import asyncio
+from collections.abc import Callable
 from datetime import timedelta
 import time
 from unittest.mock import ANY, AsyncMock, MagicMock, Mock, patch
@@ -33,6 +34,7 @@ from homeassistant.components.bluetooth.match import (
     ADDRESS,
     CONNECTABLE,
     LOCAL_NAME,
+    MANUFACTURER_DATA_START,
     MANUFACTURER_ID,
     SERVICE_DATA_UUID,
     SERVICE_UUID,
@@ -1650,6 +1652,98 @@ async def test_register_callback_by_manufacturer_id(
     assert service_info.manufacturer_id == 21
 
 
+@pytest.mark.usefixtures("enable_bluetooth")
+async def test_register_callback_by_manufacturer_id_and_manufacturer_data_start(
+    hass: HomeAssistant, mock_bleak_scanner_start: MagicMock
+) -> None:
+    """Test registering callbacks by manufacturer_id and manufacturer_data_start."""
+    mock_bt = []
+    callbacks: dict[str, list[BluetoothServiceInfo]] = {
+        "homekit": [],
+        "ibeacon": [],
+        "any": [],
+    }
+
+    def _make_subscriber(
+        key: str,
+    ) -> Callable[[BluetoothServiceInfo, BluetoothChange], None]:
+        def _fake_subscriber(
+            service_info: BluetoothServiceInfo, change: BluetoothChange
+        ) -> None:
+            """Fake subscriber for the BleakScanner."""
+            callbacks[key].append(service_info)
+
+        return _fake_subscriber
+
+    with patch(
+        "homeassistant.components.bluetooth.async_get_bluetooth", return_value=mock_bt
+    ):
+        await async_setup_with_default_adapter(hass)
+
+    with patch.object(hass.config_entries.flow, "async_init"):
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        cancel_homekit = bluetooth.async_register_callback(
+            hass,
+            _make_subscriber("homekit"),
+            {MANUFACTURER_ID: 76, MANUFACTURER_DATA_START: [0x06]},
+            BluetoothScanningMode.ACTIVE,
+        )
+        cancel_ibeacon = bluetooth.async_register_callback(
+            hass,
+            _make_subscriber("ibeacon"),
+            {MANUFACTURER_ID: 76, MANUFACTURER_DATA_START: [0x02, 0x15]},
+            BluetoothScanningMode.ACTIVE,
+        )
+        cancel_any = bluetooth.async_register_callback(
+            hass,
+            _make_subscriber("any"),
+            {MANUFACTURER_ID: 76},
+            BluetoothScanningMode.ACTIVE,
+        )
+
+        homekit_device = generate_ble_device("44:44:33:11:23:45", "homekit")
+        homekit_adv = generate_advertisement_data(
+            local_name="homekit", manufacturer_data={76: b"\x06\x02\x03"}
+        )
+        inject_advertisement(hass, homekit_device, homekit_adv)
+
+        ibeacon_device = generate_ble_device("44:44:33:11:23:46", "ibeacon")
+        ibeacon_adv = generate_advertisement_data(
+            local_name="ibeacon", manufacturer_data={76: b"\x02\x15\x00"}
+        )
+        inject_advertisement(hass, ibeacon_device, ibeacon_adv)
+
+        # Same first byte as iBeacon, but not a match
+        other_device = generate_ble_device("44:44:33:11:23:47", "other")
+        other_adv = generate_advertisement_data(
+            local_name="other", manufacturer_data={76: b"\x02\x16\x00"}
+        )
+        inject_advertisement(hass, other_device, other_adv)
+
+        await hass.async_block_till_done()
+
+        cancel_ibeacon()
+        ibeacon_adv = generate_advertisement_data(
+            local_name="ibeacon", manufacturer_data={76: b"\x02\x15\x01"}
+        )
+        inject_advertisement(hass, ibeacon_device, ibeacon_adv)
+        await hass.async_block_till_done()
+
+        cancel_homekit()
+        cancel_any()
+
+    assert [service_info.name for service_info in callbacks["homekit"]] == ["homekit"]
+    assert [service_info.name for service_info in callbacks["ibeacon"]] == ["ibeacon"]
+    assert [service_info.name for service_info in callbacks["any"]] == [
+        "homekit",
+        "ibeacon",
+        "other",
+        "ibeacon",
+    ]
+
+
 @pytest.mark.usefixtures("enable_bluetooth")
 async def test_register_callback_by_connectable(
     hass: HomeAssistant, mock_bleak_scanner_start: MagicMock
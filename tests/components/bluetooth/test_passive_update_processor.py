@@ -560,6 +560,108 @@ async def test_no_updates_once_stopping(hass: HomeAssistant) -> None:
     cancel_coordinator()
 
 
+@pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
+async def test_unchanged_payload_is_not_parsed_again(hass: HomeAssistant) -> None:
+    """Test an advertisement with an unchanged payload skips the update method."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    parsed: list[BluetoothServiceInfoBleak] = []
+
+    @callback
+    def _mock_update_method(
+        service_info: BluetoothServiceInfoBleak,
+    ) -> dict[str, str]:
+        parsed.append(service_info)
+        return {"test": "data"}
+
+    @callback
+    def _async_generate_mock_data(
+        data: dict[str, str],
+    ) -> PassiveBluetoothDataUpdate:
+        """Generate mock data."""
+        return GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE
+
+    coordinator = PassiveBluetoothProcessorCoordinator(
+        hass,
+        _LOGGER,
+        "aa:bb:cc:dd:ee:ff",
+        BluetoothScanningMode.ACTIVE,
+        _mock_update_method,
+    )
+    processor = PassiveBluetoothDataProcessor(_async_generate_mock_data)
+    unregister_processor = coordinator.async_register_processor(processor)
+    cancel_coordinator = coordinator.async_start()
+
+    all_events = []
+
+    def _all_listener(data: PassiveBluetoothDataUpdate | None) -> None:
+        """Mock an all listener."""
+        all_events.append(data)
+
+    processor.async_add_listener(_all_listener)
+
+    inject_bluetooth_service_info(hass, GENERIC_BLUETOOTH_SERVICE_INFO)
+    assert len(parsed) == 1
+    assert len(all_events) == 1
+
+    # The same payload dispatched again, for example after the device
+    # switched scanners, does not need to be parsed again
+    coordinator._async_handle_bluetooth_event(parsed[0], BluetoothChange.ADVERTISEMENT)
+    assert len(parsed) == 1
+    assert len(all_events) == 1
+
+    # The same payload with a new rssi only updates the rssi
+    service_info_new_rssi = BluetoothServiceInfoBleak(
+        name=parsed[0].name,
+        address=parsed[0].address,
+        rssi=-60,
+        manufacturer_data=dict(parsed[0].manufacturer_data),
+        service_data=parsed[0].service_data,
+        service_uuids=parsed[0].service_uuids,
+        source="other",
+        time=time.monotonic(),
+        device=MagicMock(),
+        advertisement=MagicMock(),
+        connectable=True,
+        tx_power=0,
+    )
+    coordinator._async_handle_bluetooth_event(
+        service_info_new_rssi, BluetoothChange.ADVERTISEMENT
+    )
+    assert len(parsed) == 1
+    assert len(all_events) == 1
+    assert coordinator.rssi == -60
+
+    service_info_new_rssi.manufacturer_data[1] = b"\x02"
+    coordinator._async_handle_bluetooth_event(
+        service_info_new_rssi, BluetoothChange.ADVERTISEMENT
+    )
+    assert len(parsed) == 2
+    assert len(all_events) == 2
+
+    # Mutating the dict of the last parsed payload is seen as a change
+    service_info_new_rssi.manufacturer_data[1] = b"\x03"
+    coordinator._async_handle_bluetooth_event(
+        service_info_new_rssi, BluetoothChange.ADVERTISEMENT
+    )
+    assert len(parsed) == 3
+    assert len(all_events) == 3
+
+    # A newly registered processor needs to see the next advertisement
+    processor_2 = PassiveBluetoothDataProcessor(_async_generate_mock_data)
+    unregister_processor_2 = coordinator.async_register_processor(processor_2)
+    coordinator._async_handle_bluetooth_event(parsed[0], BluetoothChange.ADVERTISEMENT)
+    assert len(parsed) == 4
+    assert len(all_events) == 4
+
+    inject_bluetooth_service_info(hass, GENERIC_BLUETOOTH_SERVICE_INFO_2)
+    assert len(parsed) == 5
+    assert len(all_events) == 5
+
+    unregister_processor_2()
+    unregister_processor()
+    cancel_coordinator()
+
+
 @pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
 async def test_exception_from_update_method(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
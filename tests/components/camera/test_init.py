@@ -1,5 +1,6 @@
 """The tests for the camera component."""
 
+import asyncio
 from http import HTTPStatus
 import io
 from types import ModuleType
@@ -1094,3 +1095,58 @@ async def test_entity_picture_url_changes_on_token_update(hass: HomeAssistant) -
     new_entity_picture = camera_state.attributes["entity_picture"]
     assert new_entity_picture != original_picture
     assert "token=" in new_entity_picture
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_concurrent_image_requests_share_fetch(hass: HomeAssistant) -> None:
+    """Test concurrent image requests only fetch a single image from the camera."""
+    fetch_started = asyncio.Event()
+    release_fetch = asyncio.Event()
+
+    async def _async_camera_image(*args, **kwargs) -> bytes:
+        fetch_started.set()
+        await release_fetch.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_async_camera_image,
+    ) as mock_camera_image:
+        first = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        second = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await fetch_started.wait()
+        release_fetch.set()
+        images = await asyncio.gather(first, second)
+
+        assert mock_camera_image.call_count == 1
+        assert [image.content for image in images] == [b"Test", b"Test"]
+
+        # Without mjpeg streams running the next request fetches a new image
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 2
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_mjpeg_stream_frames_shared_with_snapshots(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test snapshots are served from the frame of a running mjpeg stream."""
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera_image:
+        async with client.get(
+            "/api/camera_proxy_stream/camera.demo_camera"
+        ) as response:
+            assert response.status == HTTPStatus.OK
+            await response.content.readuntil(b"Test")
+            assert mock_camera_image.call_count == 1
+
+            image = await camera.async_get_image(hass, "camera.demo_camera")
+            assert image.content == b"Test"
+            assert mock_camera_image.call_count == 1
@@ -3,7 +3,13 @@
 from collections import defaultdict
 from unittest.mock import AsyncMock, patch
 
-from hassil.recognize import Intent, IntentData, MatchEntity, RecognizeResult
+from hassil.recognize import (
+    Intent,
+    IntentData,
+    MatchEntity,
+    RecognizeResult,
+    recognize_all,
+)
 import pytest
 
 from homeassistant.components import conversation, cover, media_player
@@ -1322,3 +1328,37 @@ async def test_name_wildcard_lower_priority(
     assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
     assert not beer_handler.triggered
     assert food_handler.triggered
+
+
+async def test_intents_and_names_pruned_by_index(
+    hass: HomeAssistant, init_components
+) -> None:
+    """Test only sentences and names containing the input words are matched."""
+    hass.states.async_set(
+        "light.kitchen", "off", attributes={ATTR_FRIENDLY_NAME: "Kitchen Light"}
+    )
+    hass.states.async_set(
+        "light.bedroom", "off", attributes={ATTR_FRIENDLY_NAME: "Bedroom Lamp"}
+    )
+    calls = async_mock_service(hass, "light", "turn_on")
+
+    with patch(
+        "homeassistant.components.conversation.default_agent.recognize_all",
+        wraps=recognize_all,
+    ) as mock_recognize_all:
+        result = await conversation.async_converse(
+            hass, "turn on the kitchen light", None, Context(), None
+        )
+
+    assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+    assert len(calls) == 1
+    assert calls[0].data == {"entity_id": ["light.kitchen"]}
+
+    intents = mock_recognize_all.call_args[0][1]
+    assert "HassTurnOn" in intents.intents
+    assert "HassGetWeather" not in intents.intents
+
+    slot_lists = mock_recognize_all.call_args.kwargs["slot_lists"]
+    assert [value.value_out for value in slot_lists["name"].values] == [
+        "Kitchen Light"
+    ]
@@ -7,19 +7,25 @@ from homeassistant.components.homeassistant.exposed_entities import (
     DATA_EXPOSED_ENTITIES,
     ExposedEntities,
     ExposedEntity,
+    ExposedEntityInfo,
     async_expose_entity,
     async_get_assistant_settings,
     async_get_entity_settings,
+    async_get_exposed_entities_snapshot,
     async_listen_entity_updates,
     async_should_expose,
 )
 from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.setup import async_setup_component
 
-from tests.common import flush_store
+from tests.common import MockConfigEntry, flush_store
 from tests.typing import WebSocketGenerator
 
 
@@ -555,3 +561,65 @@ async def test_listeners(
 
     entry1 = entity_registry.async_get_or_create("switch", "test", "unique1")
     async_expose_entity(hass, "test1", entry1.entity_id, True)
+
+
+async def test_exposed_entities_snapshot(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the snapshot of exposed entities is updated incrementally."""
+    assert await async_setup_component(hass, "homeassistant", {})
+
+    hass.states.async_set("light.kitchen", "on", {"friendly_name": "Kitchen"})
+    hass.states.async_set("sensor.hidden", "on")
+
+    snapshot = async_get_exposed_entities_snapshot(hass, "conversation")
+    assert snapshot is async_get_exposed_entities_snapshot(hass, "conversation")
+    assert snapshot.entities == {
+        "light.kitchen": ExposedEntityInfo("light.kitchen", "Kitchen", [], None)
+    }
+    kitchen_info = snapshot.entities["light.kitchen"]
+    version = snapshot.version
+
+    # State changes that don't change the name are ignored
+    hass.states.async_set("light.kitchen", "off", {"friendly_name": "Kitchen"})
+    assert snapshot.version == version
+
+    # New entities are added, existing entities are kept
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, connections={("test", "1234")}
+    )
+    entry = entity_registry.async_get_or_create(
+        "light", "test", "unique1", device_id=device.id
+    )
+    hass.states.async_set(entry.entity_id, "on", {"friendly_name": "Bedroom"})
+    assert snapshot.version > version
+    assert snapshot.entities["light.kitchen"] is kitchen_info
+    assert snapshot.entities[entry.entity_id] == ExposedEntityInfo(
+        entry.entity_id, "Bedroom", [], None
+    )
+
+    # Aliases and the device area are picked up from the registries
+    area = area_registry.async_create("Bedroom")
+    device_registry.async_update_device(device.id, area_id=area.id)
+    entity_registry.async_update_entity(entry.entity_id, aliases={"Bed light"})
+    assert snapshot.entities[entry.entity_id] == ExposedEntityInfo(
+        entry.entity_id, "Bedroom", ["Bed light"], area.id
+    )
+    assert snapshot.entities["light.kitchen"] is kitchen_info
+
+    # Area changes only bump the version
+    version = snapshot.version
+    area_registry.async_update(area.id, name="Guest room")
+    assert snapshot.version == version + 1
+
+    # Unexposed and removed entities are dropped
+    async_expose_entity(hass, "conversation", entry.entity_id, False)
+    assert entry.entity_id not in snapshot.entities
+
+    hass.states.async_remove("light.kitchen")
+    assert snapshot.entities == {}
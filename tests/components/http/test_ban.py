@@ -1,5 +1,6 @@
 """The tests for the Home Assistant HTTP component."""
 
+import asyncio
 from http import HTTPStatus
 from ipaddress import ip_address
 import os
@@ -423,3 +424,28 @@ async def test_single_ban_file_entry(
         await manager.async_add_ban(remote_ip)
 
     assert m_open.call_count == 1
+
+
+async def test_concurrent_bans_share_file_write(
+    hass: HomeAssistant,
+) -> None:
+    """Test bans added while a write is in progress are written together."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    setup_bans(hass, app, 2)
+    manager = app[KEY_BAN_MANAGER]
+    m_open = mock_open()
+
+    with patch("homeassistant.components.http.ban.open", m_open, create=True):
+        await asyncio.gather(
+            *(
+                manager.async_add_ban(ip_address(f"200.201.202.{idx}"))
+                for idx in range(3)
+            )
+        )
+
+    assert m_open.call_count == 2
+    written = "".join(call.args[0] for call in m_open().write.call_args_list)
+    for idx in range(3):
+        assert f"200.201.202.{idx}:" in written
+
@@ -2,13 +2,18 @@
 
 from http import HTTPStatus
 from pathlib import Path
+from unittest.mock import patch
 
 from aiohttp.test_utils import TestClient
 from aiohttp.web_exceptions import HTTPForbidden
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource, _get_file_path
+from homeassistant.components.http.static import (
+    CachingStaticResource,
+    _get_file_etags,
+    _get_file_path,
+)
 from homeassistant.core import EVENT_HOMEASSISTANT_START, HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
 from homeassistant.setup import async_setup_component
@@ -81,3 +86,37 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_not_modified(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test revalidation is answered from the cached ETags."""
+    (tmp_path / "card.js").write_text("console.log('card');")
+    app = hass.http.app
+    resource = CachingStaticResource("/cards", str(tmp_path))
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    resp = await mock_http_client.get("/cards/card.js")
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    with patch(
+        "homeassistant.components.http.static._get_file_etags",
+        wraps=_get_file_etags,
+    ) as mock_get_etags:
+        for _ in range(2):
+            resp = await mock_http_client.get(
+                "/cards/card.js", headers={"If-None-Match": etag}
+            )
+            assert resp.status == HTTPStatus.NOT_MODIFIED
+            assert resp.headers["ETag"] == etag
+            assert resp.headers["Cache-Control"].startswith("public")
+        assert mock_get_etags.call_count == 1
+
+        resp = await mock_http_client.get(
+            "/cards/card.js", headers={"If-None-Match": '"other"'}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert await resp.text() == "console.log('card');"
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+import os
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
@@ -51,6 +53,12 @@ def mock_batch_timeout(hass, monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_spool_dir(hass, tmp_path):
+    """Keep the spool of failed writes out of the shared test config dir."""
+    hass.config.config_dir = str(tmp_path)
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture(
     request: pytest.FixtureRequest,
@@ -1383,7 +1391,79 @@ async def test_event_listener_scheduled_write(
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    # The spooled event is replayed before the new one is written
+    assert write_api.call_count == 4
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call", "test_exception"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+            influxdb.exceptions.InfluxDBClientError(
+                "fail", code=HTTPStatus.BAD_REQUEST
+            ),
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+            influxdb.ApiException(status=HTTPStatus.BAD_REQUEST, http_resp=MagicMock()),
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool(
+    hass: HomeAssistant,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+    test_exception,
+) -> None:
+    """Test failed writes are spooled and replayed in order."""
+    config = {"max_retries": 0}
+    config.update(config_ext)
+    await _setup(hass, mock_client, config, get_write_api)
+    write_api = get_write_api(mock_client)
+    spool = hass.data[influxdb.DOMAIN].spool
+    write_api.side_effect = OSError("foo")
+
+    for value in (1, 2):
+        hass.states.async_set("fake.something", value)
+        await hass.async_block_till_done()
+        await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 2
+    assert spool.size > 0
+    assert [event["fields"]["value"] for event in spool.read()] == [1, 2]
+
+    # A rejected new batch does not discard the spooled events
+    write_api.side_effect = [None, test_exception]
+    hass.states.async_set("fake.something", 3)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    assert write_api.call_count == 4
+
+    def _body(*values: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "measurement": "fake.something",
+                "tags": {"domain": "fake", "entity_id": "something"},
+                "time": ANY,
+                "fields": {"value": value},
+            }
+            for value in values
+        ]
+
+    assert write_api.call_args_list[-2] == get_mock_call(_body(1, 2))
+    assert write_api.call_args_list[-1] == get_mock_call(_body(3))
+    assert spool.size == 0
+    assert not os.path.exists(spool.path)
 
 
 @pytest.mark.parametrize(
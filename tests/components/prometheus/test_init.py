@@ -196,6 +196,84 @@ async def test_view_default_namespace(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics_filtered(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test filtered OpenMetrics output is cached until the metrics change."""
+    with mock.patch(
+        "homeassistant.components.prometheus._generate_exposition",
+        wraps=prometheus._generate_exposition,
+    ) as mock_generate:
+        for _ in range(2):
+            resp = await client.get(
+                prometheus.API_ENDPOINT,
+                params={"name[]": "entity_available"},
+                headers={
+                    "Accept": "application/openmetrics-text",
+                    "Accept-Encoding": "gzip",
+                },
+            )
+            assert resp.status == HTTPStatus.OK
+            assert resp.headers["content-type"] == (
+                prometheus_client.openmetrics.exposition.CONTENT_TYPE_LATEST
+            )
+            assert resp.headers["content-encoding"] == "gzip"
+            body = await resp.text()
+
+            assert (
+                'entity_available{domain="sensor",'
+                'entity="sensor.radio_energy",'
+                'friendly_name="Radio Energy"} 1.0' in body
+            )
+            assert "last_updated_time_seconds" not in body
+            assert body.endswith("# EOF\n")
+            assert body.count("# EOF") == 1
+
+        # The entity metrics are only rendered for the first request
+        assert mock_generate.call_count == 2
+        assert mock_generate.call_args_list[0].args[2] is None
+        assert mock_generate.call_args_list[1].args[2] is not None
+
+        # Process and GC metrics are not cached
+        for _ in range(2):
+            resp = await client.get(
+                prometheus.API_ENDPOINT,
+                headers={"Accept": "application/openmetrics-text"},
+            )
+            body = await resp.text()
+            assert "python_gc_objects_collected_total" in body
+            assert "entity_available" in body
+            assert body.count("# EOF") == 1
+        assert mock_generate.call_args_list[3].args[2] is not None
+
+        hass.states.async_set(
+            "sensor.radio_energy",
+            STATE_UNAVAILABLE,
+            {ATTR_FRIENDLY_NAME: "Radio Energy"},
+        )
+        await hass.async_block_till_done()
+
+        resp = await client.get(
+            prometheus.API_ENDPOINT,
+            params={"name[]": "entity_available"},
+            headers={
+                "Accept": "application/openmetrics-text",
+                "Accept-Encoding": "gzip",
+            },
+        )
+        body = await resp.text()
+        assert mock_generate.call_count == 5
+        assert mock_generate.call_args_list[4].args[2] is None
+        assert (
+            'entity_available{domain="sensor",'
+            'entity="sensor.radio_energy",'
+            'friendly_name="Radio Energy"} 0.0' in body
+        )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
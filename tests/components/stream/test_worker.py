@@ -410,6 +410,44 @@ async def test_skip_out_of_order_packet(hass: HomeAssistant) -> None:
     assert len(decoded_stream.audio_packets) == 0
 
 
+async def test_worker_stats_diagnostics(hass: HomeAssistant) -> None:
+    """Test the worker reports packet stats and dropped packets in diagnostics."""
+    packets = list(PacketSequence(TEST_SEQUENCE_LENGTH))
+    out_of_order_index = OUT_OF_ORDER_PACKET_INDEX
+    if packets[out_of_order_index].is_keyframe:
+        out_of_order_index += 1
+    packets[out_of_order_index].dts = -9090
+
+    stream = Stream(
+        hass,
+        STREAM_SOURCE,
+        {},
+        hass.data[DOMAIN][ATTR_SETTINGS],
+        dynamic_stream_settings(),
+    )
+    stream.add_provider(HLS_PROVIDER)
+    py_av = MockPyAv()
+    py_av.container.packets = iter(packets)
+
+    with (
+        patch("av.open", new=py_av.open),
+        patch(
+            "homeassistant.components.stream.core.StreamOutput.put",
+            side_effect=py_av.capture_buffer.capture_output_segment,
+        ),
+        patch("homeassistant.components.stream.worker.STREAM_STATS_INTERVAL", 0),
+        pytest.raises(StreamEndedError),
+    ):
+        run_worker(hass, stream, STREAM_SOURCE)
+    await hass.async_block_till_done()
+
+    diagnostics = stream.get_diagnostics()
+    assert diagnostics["dropped_packet"] == 1
+    assert diagnostics["packet_rate"] > 0
+    assert diagnostics["remux_time"] >= 0
+    assert diagnostics["worker_cpu_percent"] >= 0
+
+
 async def test_discard_old_packets(hass: HomeAssistant) -> None:
     """Skip a series of out of order packets."""
 
@@ -1015,6 +1053,43 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_cached(hass: HomeAssistant, h264_video, filename) -> None:
+    """Test images are encoded once per keyframe and size."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await stream.async_record(filename)
+
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 1
+
+    assert await stream.async_get_image(width=4, height=2) == EMPTY_8_6_JPEG
+    assert await stream.async_get_image(width=4, height=2) == EMPTY_8_6_JPEG
+    assert encode.call_count == 2
+    assert encode.call_args[0][0].shape[:2] == (2, 4)
+
+    diagnostics = stream.get_diagnostics()
+    # The keyframe is decoded again for the new size since decoded frames
+    # are not kept once their image is cached
+    assert diagnostics["keyframe_decode"] == 2
+    assert diagnostics["keyframe_image_cache_hit"] == 2
+    assert diagnostics["keyframe_image_cache_miss"] == 2
+    assert diagnostics["keyframe_image_cache_hit_rate"] == 0.5
+    assert diagnostics["keyframe_decode_time"] >= 0
+    assert diagnostics["keyframe_encode_time"] >= 0
+
+    await stream.stop()
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
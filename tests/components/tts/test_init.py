@@ -1,11 +1,14 @@
 """The tests for the TTS component."""
 
 import asyncio
+from collections.abc import AsyncGenerator
 from http import HTTPStatus
+import os
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from aiohttp import ClientPayloadError
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 
@@ -31,6 +34,7 @@ from .common import (
     SUPPORT_LANGUAGES,
     TEST_DOMAIN,
     MockProvider,
+    MockTTS,
     MockTTSEntity,
     get_media_source_url,
     mock_config_entry_setup,
@@ -38,7 +42,13 @@ from .common import (
     retrieve_media,
 )
 
-from tests.common import async_mock_service, mock_restore_cache
+from tests.common import (
+    MockModule,
+    async_mock_service,
+    mock_integration,
+    mock_platform,
+    mock_restore_cache,
+)
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 ORIG_WRITE_TAGS = tts.SpeechManager.write_tags
@@ -1209,6 +1219,82 @@ async def test_load_cache_legacy_retrieve_without_mem_cache(
     assert await req.read() == tts_data
 
 
+async def test_cache_evicts_least_recently_used(
+    hass: HomeAssistant,
+    mock_provider: MockProvider,
+    mock_tts_cache_dir: Path,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the least recently used files are removed above the max cache size."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    cache_files = [
+        mock_tts_cache_dir / f"{char * 40}_en-us_-_test.mp3" for char in "abc"
+    ]
+    for mtime, cache_file in enumerate(cache_files, 1):
+        cache_file.write_bytes(b"0123456789")
+        os.utime(cache_file, (mtime, mtime))
+
+    mock_integration(hass, MockModule(domain=TEST_DOMAIN))
+    mock_platform(hass, f"{TEST_DOMAIN}.{tts.DOMAIN}", MockTTS(mock_provider))
+    assert await async_setup_component(
+        hass,
+        tts.DOMAIN,
+        {tts.DOMAIN: {"platform": TEST_DOMAIN, "cache_max_size": 1}},
+    )
+    # Sizes and last use of the cached files are read in the background
+    await hass.async_block_till_done(wait_background_tasks=True)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.cache_max_size == 1024 * 1024
+    assert list(manager.file_cache_sizes) == [
+        f"{char * 40}_en-us_-_test" for char in "abc"
+    ]
+
+    # Reading a file marks it as the most recently used
+    client = await hass_client()
+    req = await client.get(f"/api/tts_proxy/{cache_files[0].name}")
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"0123456789"
+
+    manager.cache_max_size = 20
+    await hass.services.async_call(
+        tts.DOMAIN,
+        "test_say",
+        {
+            ATTR_ENTITY_ID: "media_player.something",
+            tts.ATTR_MESSAGE: "There is someone at the door.",
+        },
+        blocking=True,
+    )
+    assert len(calls) == 1
+    await get_media_source_url(hass, calls[0].data[ATTR_MEDIA_CONTENT_ID])
+    await hass.async_block_till_done()
+
+    assert cache_files[0].is_file()
+    assert not cache_files[1].is_file()
+    assert cache_files[2].is_file()
+    assert (
+        mock_tts_cache_dir / "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_test.mp3"
+    ).is_file()
+
+
+async def test_cache_without_max_size(
+    hass: HomeAssistant, mock_provider: MockProvider, mock_tts_cache_dir: Path
+) -> None:
+    """Test cached files are not read or evicted when no max size is set."""
+    cache_file = mock_tts_cache_dir / f"{'a' * 40}_en-us_-_test.mp3"
+    cache_file.write_bytes(b"0123456789")
+
+    with patch("homeassistant.components.tts._get_cache_files_usage") as mock_usage:
+        await mock_setup(hass, mock_provider)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.cache_max_size == 0
+    assert list(manager.file_cache) == [f"{'a' * 40}_en-us_-_test"]
+    assert not mock_usage.called
+    assert cache_file.is_file()
+
+
 async def test_load_cache_retrieve_without_mem_cache(
     hass: HomeAssistant,
     mock_tts_entity: MockTTSEntity,
@@ -1559,6 +1645,8 @@ async def test_fetching_in_async(
 
     req = await client_get_task
     assert req.status == HTTPStatus.OK
+    # Engines that do not stream are served with a length
+    assert req.content_length == 4
     assert await req.read() == b"test"
 
     # Test error is not cached
@@ -1578,6 +1666,94 @@ async def test_fetching_in_async(
     )
 
 
+async def test_streaming_in_async(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test audio is served while a streaming engine is still synthesizing."""
+    second_sentence: asyncio.Future[bytes] = asyncio.Future()
+
+    class EntityWithStreaming(MockTTSEntity):
+        """Entity that streams audio sentence by sentence."""
+
+        async def async_stream_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioStreamType:
+            async def stream_audio() -> AsyncGenerator[bytes]:
+                yield b"sentence 1 "
+                yield await second_sentence
+
+            return ("mp3", stream_audio())
+
+    await mock_config_entry_setup(hass, EntityWithStreaming(DEFAULT_LANG))
+
+    media_source_id = tts.generate_media_source_id(
+        hass,
+        "Sentence 1. Sentence 2.",
+        "tts.test",
+        "en_US",
+        cache=None,
+    )
+    media_task = hass.async_create_task(
+        tts.async_get_media_source_audio(hass, media_source_id)
+    )
+
+    url = await get_media_source_url(hass, media_source_id)
+    client = await hass_client()
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert await req.content.readexactly(11) == b"sentence 1 "
+    assert not media_task.done()
+
+    second_sentence.set_result(b"sentence 2")
+
+    assert await req.read() == b"sentence 2"
+    assert await media_task == ("mp3", b"sentence 1 sentence 2")
+
+    # Later requests are served from the cache
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"sentence 1 sentence 2"
+
+
+async def test_streaming_error_closes_response(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test an error while streaming does not end the audio as complete."""
+    second_sentence: asyncio.Future[bytes] = asyncio.Future()
+
+    class EntityWithStreaming(MockTTSEntity):
+        """Entity that streams audio sentence by sentence."""
+
+        async def async_stream_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioStreamType:
+            async def stream_audio() -> AsyncGenerator[bytes]:
+                yield b"sentence 1 "
+                yield await second_sentence
+
+            return ("mp3", stream_audio())
+
+    await mock_config_entry_setup(hass, EntityWithStreaming(DEFAULT_LANG))
+
+    media_source_id = tts.generate_media_source_id(
+        hass,
+        "Sentence 1. Sentence 2.",
+        "tts.test",
+        "en_US",
+        cache=None,
+    )
+    url = await get_media_source_url(hass, media_source_id)
+    client = await hass_client()
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert await req.content.readexactly(11) == b"sentence 1 "
+
+    second_sentence.set_exception(HomeAssistantError("test error"))
+
+    with pytest.raises(ClientPayloadError):
+        await req.read()
+
+
 @pytest.mark.parametrize(
     ("setup", "engine_id"),
     [
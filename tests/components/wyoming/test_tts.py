@@ -81,6 +81,35 @@ async def test_get_tts_audio(
     assert mock_client.written == snapshot
 
 
+async def test_stream_tts_audio(hass: HomeAssistant, init_wyoming_tts) -> None:
+    """Test audio chunks are passed on as they are received."""
+    audio = bytes(100)
+    audio_events = [
+        AudioChunk(audio=audio, rate=16000, width=2, channels=1).event(),
+        AudioChunk(audio=audio, rate=16000, width=2, channels=1).event(),
+        AudioStop().event(),
+    ]
+    entity = hass.data[DATA_INSTANCES]["tts"].get_entity("tts.test_tts")
+    assert entity is not None
+
+    with patch(
+        "homeassistant.components.wyoming.tts.AsyncTcpClient",
+        MockAsyncTcpClient(audio_events),
+    ):
+        extension, chunk_stream = await entity.async_stream_tts_audio(
+            "Hello world", "en-US", {}
+        )
+        chunks = [chunk async for chunk in chunk_stream]
+
+    assert extension == "wav"
+    assert chunks[1:] == [audio, audio]
+    with io.BytesIO(b"".join(chunks)) as wav_io, wave.open(wav_io, "rb") as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.getsampwidth() == 2
+        assert wav_file.getnchannels() == 1
+        assert wav_file.readframes(wav_file.getnframes()) == audio + audio
+
+
 async def test_get_tts_audio_different_formats(
     hass: HomeAssistant, init_wyoming_tts, snapshot: SnapshotAssertion
 ) -> None:
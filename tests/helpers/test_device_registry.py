@@ -2408,6 +2408,37 @@ async def test_entries_for_label(
     assert not dr.async_entries_for_label(device_registry, "")
 
 
+async def test_entries_for_name(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test getting device entries by name."""
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+
+    entry_1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("bridgeid", "0123")},
+        name="Lamp",
+    )
+    entry_2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("bridgeid", "0456")},
+        name="Plug",
+    )
+
+    assert dr.async_entries_for_name(device_registry, "Lamp") == [entry_1]
+    assert dr.async_entries_for_name(device_registry, "Plug") == [entry_2]
+
+    entry_2 = device_registry.async_update_device(entry_2.id, name_by_user="Lamp")
+    assert dr.async_entries_for_name(device_registry, "Lamp") == [entry_1, entry_2]
+    assert not dr.async_entries_for_name(device_registry, "Plug")
+
+    device_registry.async_remove_device(entry_1.id)
+    assert dr.async_entries_for_name(device_registry, "Lamp") == [entry_2]
+    assert not dr.async_entries_for_name(device_registry, "unknown")
+    assert not dr.async_entries_for_name(device_registry, "")
+
+
 @pytest.mark.parametrize(
     (
         "translation_key",
@@ -19,7 +19,9 @@ import voluptuous as vol
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_PICTURE,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -2461,6 +2463,93 @@ async def test_cached_entity_property_override(hass: HomeAssistant) -> None:
                 return "🤡"
 
 
+async def test_static_state_attributes_cached(hass: HomeAssistant) -> None:
+    """Test the static state attributes are cached and invalidated."""
+
+    class CachedEntity(entity.Entity):
+        """An entity with only cached static state attribute properties."""
+
+        _attr_icon = "mdi:one"
+        _attr_name = "Cached"
+
+        @cached_property
+        def entity_picture(self) -> str | None:
+            """Return the entity picture."""
+            return f"/picture/{self.state}"
+
+    ent = CachedEntity()
+    ent.hass = hass
+    ent.entity_id = "test.cached"
+    ent.async_write_ha_state()
+    assert hass.states.get("test.cached").attributes == {
+        ATTR_ENTITY_PICTURE: "/picture/unknown",
+        ATTR_FRIENDLY_NAME: "Cached",
+        ATTR_ICON: "mdi:one",
+    }
+
+    # The cache is used while the static properties are unchanged
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    assert hass.states.get("test.cached").attributes == {
+        ATTR_ENTITY_PICTURE: "/picture/unknown",
+        ATTR_FRIENDLY_NAME: "Cached",
+        ATTR_ICON: "mdi:one",
+    }
+
+    # Setting an _attr_ of a static property invalidates the cache
+    ent._attr_icon = "mdi:two"
+    ent._attr_name = "Renamed"
+    ent.async_write_ha_state()
+    assert hass.states.get("test.cached").attributes == {
+        ATTR_ENTITY_PICTURE: "/picture/unknown",
+        ATTR_FRIENDLY_NAME: "Renamed",
+        ATTR_ICON: "mdi:two",
+    }
+
+    # Clearing a cached property directly requires invalidating the cache
+    ent.__dict__.pop("entity_picture")
+    ent._async_invalidate_static_state_attributes()
+    ent.async_write_ha_state()
+    assert hass.states.get("test.cached").attributes == {
+        ATTR_ENTITY_PICTURE: "/picture/on",
+        ATTR_FRIENDLY_NAME: "Renamed",
+        ATTR_ICON: "mdi:two",
+    }
+
+    # Deleting an _attr_ of a static property invalidates the cache
+    del ent._attr_icon
+    ent.async_write_ha_state()
+    assert hass.states.get("test.cached").attributes == {
+        ATTR_ENTITY_PICTURE: "/picture/on",
+        ATTR_FRIENDLY_NAME: "Renamed",
+        ATTR_ICON: "mdi:one",
+    }
+
+
+async def test_static_state_attributes_not_cached(hass: HomeAssistant) -> None:
+    """Test the static state attributes are not cached for plain properties."""
+
+    class UncachedEntity(entity.Entity):
+        """An entity with a plain static state attribute property."""
+
+        _attr_name = "Uncached"
+
+        @property
+        def icon(self) -> str | None:
+            """Return the icon."""
+            return f"mdi:{self.state}"
+
+    ent = UncachedEntity()
+    ent.hass = hass
+    ent.entity_id = "test.uncached"
+    ent.async_write_ha_state()
+    assert hass.states.get("test.uncached").attributes[ATTR_ICON] == "mdi:unknown"
+
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    assert hass.states.get("test.uncached").attributes[ATTR_ICON] == "mdi:on"
+
+
 async def test_entity_report_deprecated_supported_features_values(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
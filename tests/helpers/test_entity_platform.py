@@ -1193,6 +1193,105 @@ async def test_device_info_called(
     assert device.via_device_id == via.id
 
 
+async def test_device_info_resolved_once_per_batch(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test identical device info is only resolved once when adding entities."""
+    caplog.set_level(logging.DEBUG)
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    def _device_info(identifier: str) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={("hue", identifier)},
+            manufacturer="test-manuf",
+            name=f"Device {identifier}",
+            translation_placeholders={"placeholder": "value"},
+        )
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(unique_id="1", device_info=_device_info("1234")),
+                MockEntity(unique_id="2", device_info=_device_info("1234")),
+                MockEntity(unique_id="3", device_info=_device_info("1234")),
+                MockEntity(unique_id="4", device_info=_device_info("5678")),
+            ]
+        )
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as mock_get_or_create:
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(mock_get_or_create.mock_calls) == 2
+    assert len(hass.states.async_entity_ids()) == 4
+
+    device_1 = device_registry.async_get_device(identifiers={("hue", "1234")})
+    device_2 = device_registry.async_get_device(identifiers={("hue", "5678")})
+    assert device_1 is not None
+    assert device_2 is not None
+    entity_registry = er.async_get(hass)
+    assert len(er.async_entries_for_device(entity_registry, device_1.id)) == 3
+    assert len(er.async_entries_for_device(entity_registry, device_2.id)) == 1
+    assert (
+        "Adding 4 entities for domain test_domain with platform test took"
+        in caplog.text
+    )
+
+
+async def test_device_info_removed_device_during_batch(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test a device removed while adding entities is created again."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+    device_info = DeviceInfo(identifiers={("hue", "1234")}, name="Device")
+
+    class RemoveDeviceEntity(MockEntity):
+        """Entity removing its device once added."""
+
+        async def async_added_to_hass(self) -> None:
+            """Remove the device of the entity."""
+            device_registry.async_remove_device(self.device_entry.id)
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                RemoveDeviceEntity(unique_id="1", device_info=device_info),
+                MockEntity(unique_id="2", device_info=device_info),
+            ]
+        )
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    assert await entity_platform.async_setup_entry(config_entry)
+    await hass.async_block_till_done()
+
+    device = device_registry.async_get_device(identifiers={("hue", "1234")})
+    assert device is not None
+    entity_registry = er.async_get(hass)
+    entries = er.async_entries_for_device(entity_registry, device.id)
+    assert [entry.unique_id for entry in entries] == ["2"]
+
+
 async def test_device_info_not_overrides(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
@@ -626,3 +626,63 @@ async def test_assist_api_prompt(
 {area_prompt}
 {exposed_entities_prompt}"""
     )
+
+
+async def test_assist_api_prompt_cache(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the exposed entities prompt is only rendered for changed entities."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "intent", {})
+    llm_context = llm.LLMContext(
+        platform="test_platform",
+        context=Context(),
+        user_prompt="test_text",
+        language="*",
+        assistant="conversation",
+        device_id=None,
+    )
+    entry = entity_registry.async_get_or_create(
+        "light", "test", "1234", suggested_object_id="bedroom"
+    )
+    hass.states.async_set("light.kitchen", "on", {"friendly_name": "Kitchen"})
+    hass.states.async_set(entry.entity_id, "on", {"friendly_name": "Bedroom"})
+
+    with patch("homeassistant.helpers.llm.yaml.dump", wraps=yaml.dump) as mock_dump:
+        api = await llm.async_get_api(hass, "assist", llm_context)
+        assert mock_dump.call_count == 2
+        prompt = api.api_prompt
+
+        # Nothing changed
+        api = await llm.async_get_api(hass, "assist", llm_context)
+        assert mock_dump.call_count == 2
+        assert api.api_prompt == prompt
+
+        # Only the changed entity is rendered again
+        hass.states.async_set("light.kitchen", "off", {"friendly_name": "Kitchen"})
+        api = await llm.async_get_api(hass, "assist", llm_context)
+        assert mock_dump.call_count == 3
+        assert "state: 'off'" in api.api_prompt
+
+        # Names and areas follow the registries
+        area = area_registry.async_create("Living Room")
+        entity_registry.async_update_entity(
+            entry.entity_id, area_id=area.id, aliases={"Bed light"}
+        )
+        api = await llm.async_get_api(hass, "assist", llm_context)
+        assert mock_dump.call_count == 4
+
+    assert api.api_prompt.endswith(
+        yaml.dump(
+            {
+                "light.kitchen": {"names": "Kitchen", "state": "off"},
+                entry.entity_id: {
+                    "names": "Bedroom, Bed light",
+                    "state": "on",
+                    "areas": "Living Room",
+                },
+            }
+        )
+    )
@@ -162,6 +162,28 @@ def test_template_equality() -> None:
         template.Template(["{{ template_one }}"])
 
 
+def test_safe_attribute_cache(hass: HomeAssistant) -> None:
+    """Test safe attribute decisions are cached per type and attribute."""
+    hass.states.async_set("test.object", "available")
+    hass.states.async_set("test.other", "unavailable")
+    env = template.TemplateEnvironment(hass)
+    state = template.TemplateState(hass, hass.states.get("test.object"))
+    other = template.TemplateState(hass, hass.states.get("test.other"))
+
+    with patch.object(
+        env, "_is_safe_attribute", wraps=env._is_safe_attribute
+    ) as mock_is_safe:
+        assert env.is_safe_attribute(state, "state", "available")
+        assert env.is_safe_attribute(other, "state", "unavailable")
+        assert not env.is_safe_attribute(state, "_state", None)
+        assert not env.is_safe_attribute(other, "_state", None)
+        assert env.is_safe_attribute("x", "upper", None)
+        assert not env.is_safe_attribute([], "append", None)
+        assert not env.is_safe_attribute({}, "__class__", None)
+
+    assert mock_is_safe.call_count == 5
+
+
 def test_invalid_template(hass: HomeAssistant) -> None:
     """Invalid template raises error."""
     tmpl = template.Template("{{", hass)
@@ -5480,6 +5502,57 @@ async def test_parse_result(hass: HomeAssistant) -> None:
         assert template.Template(tpl, hass).async_render() == result
 
 
+@pytest.mark.parametrize(
+    ("template_string", "native"),
+    [
+        ("{{ 1 + 2 }}", True),
+        ("{{- 2.5 * 2 -}}", True),
+        ("{{ 1e100 }}", True),
+        ("{{ 10 ** 20 }}", True),
+        ("{{ -1 }}", True),
+        ("{{ is_state('sensor.temperature', '21.5') }}", True),
+        ("{{ states('sensor.temperature') }}", True),
+        ("{{ states('sensor.temperature') | float * 2 }}", True),
+        ("{{ state_attr('sensor.temperature', 'friendly_name') }}", True),
+        ("{{ state_attr('sensor.temperature', 'missing') }}", True),
+        ("{{ [1, 2] }}", True),
+        ("{{ '010' }}", True),
+        ("{{ now() }}", True),
+        ("{{ 1 }} {{ 2 }}", False),
+        ("{{ 1 }}2", False),
+        ("{% if true %}1{% endif %}", False),
+        ('{{ "{{}}" }}', False),
+    ],
+)
+async def test_native_render(
+    hass: HomeAssistant, template_string: str, native: bool
+) -> None:
+    """Test single expression templates render native results."""
+    hass.states.async_set(
+        "sensor.temperature", "21.5", {"friendly_name": "Temperature"}
+    )
+    tpl = template.Template(template_string, hass)
+    with freeze_time("2024-07-01 12:00:00"):
+        result = tpl.async_render()
+        render_result = tpl.async_render(parse_result=False)
+    assert (tpl._compiled_native is not None) is native
+    assert result == tpl._parse_result(render_result)
+    assert type(result) is type(tpl._parse_result(render_result))
+
+
+async def test_native_render_undefined(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test undefined native results render like string results."""
+    tpl = template.Template("{{ no_such_variable }}", hass)
+    assert tpl.async_render() == ""
+    assert "'no_such_variable' is undefined" in caplog.text
+
+    tpl = template.Template("{{ no_such_variable }}", hass)
+    with pytest.raises(TemplateError):
+        tpl.async_render(strict=True)
+
+
 @pytest.mark.parametrize(
     "template_string",
     [
@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -747,3 +748,133 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     unsub()
     await crd.async_refresh()
     assert len(last_update_success_times) == 1
+
+
+async def test_scheduled_refresh_concurrency_limited(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test scheduled refreshes of all coordinators are limited."""
+    limit = 2
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+        return 1
+
+    coordinators = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {idx}",
+            update_method=refresh,
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+        )
+        for idx in range(5)
+    ]
+    with patch.object(update_coordinator, "MAX_CONCURRENT_SCHEDULED_REFRESHES", limit):
+        unsubs = [crd.async_add_listener(Mock()) for crd in coordinators]
+        freezer.tick(DEFAULT_UPDATE_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=False)
+
+        assert running == limit
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert max_running == limit
+    assert running == 0
+    assert all(crd.data == 1 for crd in coordinators)
+    assert all(crd.last_update_lateness is not None for crd in coordinators)
+    assert all(crd.last_update_duration is not None for crd in coordinators)
+
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_scheduled_refresh_slot_timeout(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test hanging scheduled refreshes do not block other coordinators."""
+    limit = 2
+    running = 0
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        nonlocal running
+        running += 1
+        await release.wait()
+        return 1
+
+    coordinators = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {idx}",
+            update_method=refresh,
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+        )
+        for idx in range(4)
+    ]
+    with patch.object(update_coordinator, "MAX_CONCURRENT_SCHEDULED_REFRESHES", limit):
+        unsubs = [crd.async_add_listener(Mock()) for crd in coordinators]
+        freezer.tick(DEFAULT_UPDATE_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=False)
+        assert running == limit
+
+        # The hanging refreshes give up their slots after the timeout
+        freezer.tick(update_coordinator.SCHEDULED_REFRESH_SLOT_TIMEOUT)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=False)
+        assert running == 4
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert all(crd.data == 1 for crd in coordinators)
+
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_refresh_metrics(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test refresh duration and lateness are tracked."""
+    assert crd.last_update_duration is None
+    assert crd.last_update_lateness is None
+
+    await crd.async_refresh()
+    assert crd.last_update_duration is not None
+    # Only scheduled refreshes can be late
+    assert crd.last_update_lateness is None
+
+    unsub = crd.async_add_listener(Mock())
+    freezer.tick(crd.update_interval + timedelta(seconds=3))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert crd.data == 2
+    assert crd.last_update_lateness == pytest.approx(3, abs=1)
+    unsub()
+
+
+async def test_refresh_jitter_deterministic(hass: HomeAssistant) -> None:
+    """Test the refresh jitter is stable for a coordinator."""
+    crd1 = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    crd2 = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    assert crd1._microsecond == crd2._microsecond
+    assert (
+        update_coordinator.event.RANDOM_MICROSECOND_MIN / 10**6
+        <= crd1._microsecond
+        <= update_coordinator.event.RANDOM_MICROSECOND_MAX / 10**6
+    )